@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""Check behaviours of the Renault integration against the fake Kamereon servers.
+
+Each check sets the integration up in a throwaway Home Assistant instance, as
+run.py does, and fails with the first unexpected observation. The checks
+cover what the benchmarks do not show: what is sent to the servers, and when.
+
+Usage:
+    python benchmarks/checks.py
+    python benchmarks/checks.py charge_limits
+"""
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+import os
+import sys
+import tempfile
+
+from fake_kamereon import FakeKamereonConfig, FakeKamereonServer, get_vin
+from run import (
+    _async_set_budget,
+    _patch_locale,
+    async_setup_entry,
+    async_start_hass,
+)
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+DOMAIN = "renault"
+
+
+class CheckFailed(Exception):
+    """An observation did not match the expected behaviour."""
+
+
+def _expect(condition: bool, message: str) -> None:
+    if not condition:
+        raise CheckFailed(message)
+
+
+def _get_entity_id(hass: HomeAssistant, platform: str, key: str) -> str:
+    """Return the entity id of the first vehicle for an entity key."""
+    entity_id = er.async_get(hass).async_get_entity_id(
+        platform, DOMAIN, f"{get_vin(0)}_{key}".lower()
+    )
+    _expect(entity_id is not None, f"No {platform} entity for {key}")
+    return entity_id
+
+
+async def async_check_charge_limits(
+    hass: HomeAssistant, server: FakeKamereonServer
+) -> None:
+    """Two quick changes of the charge limits both reach the servers."""
+    await async_setup_entry(hass)
+    min_entity_id = _get_entity_id(hass, "number", "charge_limit_min")
+    target_entity_id = _get_entity_id(hass, "number", "charge_limit_target")
+    for entity_id, value in ((min_entity_id, 30), (target_entity_id, 60)):
+        await hass.services.async_call(
+            "number",
+            "set_value",
+            {"entity_id": entity_id, "value": value},
+            blocking=False,
+        )
+    await hass.async_block_till_done()
+
+    _expect(bool(server.stats.actions), "No action sent")
+    endpoint, body = server.stats.actions[-1]
+    _expect(endpoint == "soc-levels", f"Last action sent to {endpoint}")
+    _expect(
+        (body.get("socMin"), body.get("socTarget")) == (30, 60),
+        f"Last limits sent: {body}",
+    )
+    for entity_id, value in ((min_entity_id, 30), (target_entity_id, 60)):
+        state = hass.states.get(entity_id)
+        _expect(
+            state is not None and float(state.state) == value,
+            f"{entity_id} shows {state and state.state}",
+        )
+
+
+async def async_check_batch_option(
+    hass: HomeAssistant, server: FakeKamereonServer
+) -> None:
+    """The batch option of an entry switches its vehicles to batch cycles."""
+    entry, _ = await async_setup_entry(hass, {"batch_vehicle_updates": True})
+    vehicle = entry.runtime_data.vehicles[get_vin(0)]
+    _expect(vehicle.batch is not None, "No batch updater with the option set")
+    _expect(
+        all(coordinator.batched for coordinator in vehicle.coordinators.values()),
+        "Coordinators still on their own timer with the option set",
+    )
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"batch_vehicle_updates": False}
+    )
+    await hass.async_block_till_done()
+    _expect(
+        entry.options.get("batch_vehicle_updates") is False,
+        f"Options not saved: {entry.options}",
+    )
+    vehicle = entry.runtime_data.vehicles[get_vin(0)]
+    _expect(vehicle.batch is None, "Batch updater kept once the option is unset")
+    _expect(
+        not any(coordinator.batched for coordinator in vehicle.coordinators.values()),
+        "Coordinators still batched once the option is unset",
+    )
+
+
+async def async_check_batch_polling(
+    hass: HomeAssistant, server: FakeKamereonServer
+) -> None:
+    """Batch cycles start once the entities subscribed, and poll every endpoint."""
+    # one call per minute per endpoint, the shortest scan interval
+    await _async_set_budget(hass, 3600)
+    entry, _ = await async_setup_entry(hass, {"batch_vehicle_updates": True})
+    vehicle = entry.runtime_data.vehicles[get_vin(0)]
+    _expect(vehicle.batch is not None, "No batch updater with the option set")
+    _expect(vehicle.batch.interval is not None, "No batch interval once set up")
+    setup_calls = server.stats.data_calls
+
+    await asyncio.sleep(2.5 * vehicle.batch.interval.total_seconds())
+    calls = server.stats.data_calls - setup_calls
+    _expect(vehicle.batch.last_cycle is not None, "No batch cycle ran")
+    _expect(
+        calls >= 2 * len(vehicle.coordinators),
+        f"{calls} calls for {len(vehicle.coordinators)} endpoints in two cycles",
+    )
+
+
+async def async_check_cached_refresh(
+    hass: HomeAssistant, server: FakeKamereonServer
+) -> None:
+    """Stale data restored from the cache is refreshed after a restart."""
+    entry, _ = await async_setup_entry(hass)
+    # age the cached payloads beyond any scan interval
+    data_cache = entry.runtime_data.data_cache
+    stale = (dt_util.utcnow() - timedelta(days=1)).isoformat()
+    for payloads in data_cache._data.values():
+        for payload in payloads.values():
+            payload["timestamp"] = stale
+    await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+    vehicle = entry.runtime_data.vehicles[get_vin(0)]
+    _expect(
+        all(
+            coordinator.cached_at is not None
+            for coordinator in vehicle.coordinators.values()
+        ),
+        "Coordinators not restored from the cache",
+    )
+    reload_calls = server.stats.data_calls
+
+    # the first refresh is staggered by 5 seconds
+    await asyncio.sleep(8)
+    _expect(server.stats.data_calls > reload_calls, "No refresh of the cached data")
+    _expect(
+        any(
+            coordinator.cached_at is None
+            for coordinator in vehicle.coordinators.values()
+        ),
+        "All coordinators still show the cached data",
+    )
+
+
+async def async_check_cache_save(
+    hass: HomeAssistant, server: FakeKamereonServer
+) -> None:
+    """The data cache is written while the polls keep changing it."""
+    # a poll every 6 seconds, more often than the 60 seconds save delay
+    await _async_set_budget(hass, 3600)
+    entry, _ = await async_setup_entry(hass)
+    path = hass.config.path(".storage", f"{DOMAIN}.{entry.entry_id}.data")
+    await asyncio.sleep(75)
+    _expect(os.path.exists(path), "Data cache not written within the save delay")
+
+
+CHECKS: dict[
+    str,
+    tuple[
+        FakeKamereonConfig,
+        Callable[[HomeAssistant, FakeKamereonServer], Awaitable[None]],
+    ],
+] = {
+    "charge_limits": (
+        FakeKamereonConfig(latency=0.2, change_rate=0.0),
+        async_check_charge_limits,
+    ),
+    "batch_option": (FakeKamereonConfig(latency=0.0), async_check_batch_option),
+    "batch_polling": (FakeKamereonConfig(latency=0.0), async_check_batch_polling),
+    "cached_refresh": (FakeKamereonConfig(latency=0.0), async_check_cached_refresh),
+    "cache_save": (FakeKamereonConfig(latency=0.0), async_check_cache_save),
+}
+
+
+async def async_run_check(name: str, config_dir: str) -> None:
+    """Run a check in its own Home Assistant instance."""
+    config, check = CHECKS[name]
+    server = FakeKamereonServer(config)
+    server.start()
+    _patch_locale(server)
+    try:
+        hass = await async_start_hass(config_dir)
+        try:
+            await check(hass, server)
+        finally:
+            await hass.async_stop()
+    finally:
+        server.stop()
+
+
+def main() -> None:
+    """Run the checks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "checks", nargs="*", help=f"checks to run, among {', '.join(CHECKS)}"
+    )
+    names = parser.parse_args().checks or list(CHECKS)
+    if unknown := set(names) - set(CHECKS):
+        parser.error(f"unknown checks: {', '.join(sorted(unknown))}")
+    failed = 0
+    for name in names:
+        with tempfile.TemporaryDirectory(prefix="renault-check-") as config_dir:
+            try:
+                asyncio.run(async_run_check(name, config_dir))
+            except CheckFailed as err:
+                failed += 1
+                print(f"{name}: FAILED: {err}")
+            else:
+                print(f"{name}: ok")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+"""Local stand-in for the Gigya and Kamereon servers, used by the benchmarks.
+
+The server answers the calls made by renault-api for an account of N vehicles,
+each supporting the first M data endpoints: the other endpoints answer as not
+supported, as the real servers do. Latency, throttling and data changes are
+configurable, and every request is counted.
+
+The server runs its own event loop in a thread, so that its work does not
+show in the event loop lag measured on the Home Assistant loop.
+"""
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+import json
+import random
+import threading
+import time
+from typing import Any
+
+from aiohttp import web
+import jwt
+from renault_api.const import (
+    CONF_GIGYA_APIKEY,
+    CONF_GIGYA_URL,
+    CONF_KAMEREON_APIKEY,
+    CONF_KAMEREON_URL,
+)
+
+ACCOUNT_ID = "account-benchmark"
+PERSON_ID = "person-benchmark"
+# undocumented model, for which renault-api assumes all the endpoints exist
+MODEL_CODE = "XBENCH"
+
+# data endpoints in the order of the integration coordinators
+DATA_ENDPOINTS = (
+    "cockpit",
+    "hvac-status",
+    "location",
+    "battery-status",
+    "charge-mode",
+    "charging-settings",
+    "lock-status",
+    "res-state",
+    "pressure",
+    "soc-levels",
+)
+
+# endpoints answered with the whole payload instead of data attributes
+_RAW_ENDPOINTS = {"soc-levels"}
+
+_ROUTE = (
+    "/commerce/v1/accounts/{account_id}/kamereon"
+    r"/{adapter:kca/car-adapter/v\d+/cars|kcm/v\d+/vehicles}"
+    "/{vin}/{endpoint:.+}"
+)
+
+
+@dataclass
+class FakeKamereonConfig:
+    """Behaviour of the fake servers."""
+
+    vehicles: int = 1
+    endpoints: int = len(DATA_ENDPOINTS)
+    # seconds added to each answer, with a uniform jitter of up to jitter
+    latency: float = 0.1
+    jitter: float = 0.0
+    # probability that a Kamereon call is refused with a quota error
+    throttle_rate: float = 0.0
+    # probability that the data of an endpoint changed since the last call
+    change_rate: float = 0.3
+    seed: int = 0
+
+
+@dataclass
+class FakeKamereonStats:
+    """Requests received by the fake servers."""
+
+    requests: Counter[str] = field(default_factory=Counter)
+    throttled: int = 0
+    # endpoint and body of each action accepted, in order
+    actions: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+
+    @property
+    def data_calls(self) -> int:
+        """Return the number of data and action calls to Kamereon."""
+        return sum(
+            count
+            for kind, count in self.requests.items()
+            if not kind.startswith(("gigya/", "vehicles"))
+        )
+
+    def snapshot(self) -> dict[str, int]:
+        """Return a copy of the request counts."""
+        return dict(self.requests)
+
+
+def get_vin(index: int) -> str:
+    """Return the VIN of a vehicle of the fake account."""
+    return f"VF1BENCH{index:09d}"
+
+
+def _timestamp() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def _get_attributes(endpoint: str, version: int) -> dict[str, Any]:
+    """Return the data of an endpoint, each version being different."""
+    match endpoint:
+        case "cockpit":
+            return {"totalMileage": 10000.0 + version}
+        case "hvac-status":
+            return {
+                "externalTemperature": 10.0 + version % 15,
+                "hvacStatus": "on" if version % 5 == 0 else "off",
+            }
+        case "location":
+            return {
+                "gpsLatitude": 48.0 + version / 10000,
+                "gpsLongitude": 2.0 + version / 10000,
+                "lastUpdateTime": _timestamp(),
+            }
+        case "battery-status":
+            return {
+                "timestamp": _timestamp(),
+                "batteryLevel": 20 + version % 80,
+                "batteryAutonomy": 60 + version % 240,
+                "batteryAvailableEnergy": 10 + version % 40,
+                "batteryTemperature": 20,
+                "plugStatus": 1 if version % 2 else 0,
+                "chargingStatus": 1.0 if version % 2 else 0.0,
+                "chargingRemainingTime": 100,
+                "chargingInstantaneousPower": 7.0 if version % 2 else 0.0,
+            }
+        case "charge-mode":
+            return {"chargeMode": "always" if version % 2 else "always_charging"}
+        case "charging-settings":
+            return {"mode": "scheduled", "schedules": []}
+        case "lock-status":
+            return {
+                "lockStatus": "locked" if version % 2 else "unlocked",
+                "doorStatusRearLeft": "closed",
+                "doorStatusRearRight": "closed",
+                "doorStatusDriver": "closed",
+                "doorStatusPassenger": "closed",
+                "hatchStatus": "closed",
+                "lastUpdateTime": _timestamp(),
+            }
+        case "res-state":
+            return {"details": "-", "code": "0"}
+        case "pressure":
+            return {
+                "flPressure": 2700 + version % 100,
+                "frPressure": 2700,
+                "rlPressure": 2700,
+                "rrPressure": 2700,
+                "flStatus": 0,
+                "frStatus": 0,
+                "rlStatus": 0,
+                "rrStatus": 0,
+            }
+        case "soc-levels":
+            return {
+                "socMin": 15,
+                "socTarget": 80 + version % 3 * 5,
+                "lastEnergyUpdateTimestamp": _timestamp(),
+            }
+    raise KeyError(endpoint)
+
+
+class FakeKamereonServer:
+    """Gigya and Kamereon endpoints served on localhost."""
+
+    def __init__(self, config: FakeKamereonConfig) -> None:
+        """Initialise server."""
+        self.config = config
+        self.stats = FakeKamereonStats()
+        self.url = ""
+        self._random = random.Random(config.seed)
+        self._vins = [get_vin(index) for index in range(config.vehicles)]
+        self._supported = set(DATA_ENDPOINTS[: config.endpoints])
+        # current version of the data, by vin and endpoint
+        self._versions: dict[tuple[str, str], int] = {}
+        self._jwt = jwt.encode(
+            {"exp": int(time.time()) + 24 * 3600}, "benchmark", algorithm="HS256"
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._runner: web.AppRunner | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def locale_details(self) -> dict[str, str]:
+        """Return the renault-api locale details pointing to this server."""
+        return {
+            CONF_GIGYA_APIKEY: "benchmark",
+            CONF_GIGYA_URL: f"{self.url}/gigya",
+            CONF_KAMEREON_APIKEY: "benchmark",
+            CONF_KAMEREON_URL: self.url,
+        }
+
+    def start(self) -> None:
+        """Start the server in its own thread and event loop."""
+        started = threading.Event()
+
+        def _run() -> None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self._async_start())
+            started.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self._async_stop())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=_run, name="fake-kamereon", daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop(self) -> None:
+        """Stop the server and its thread."""
+        if self._loop is None or self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    async def _async_start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/gigya/accounts.login", self._gigya_login)
+        app.router.add_post("/gigya/accounts.getAccountInfo", self._gigya_account)
+        app.router.add_post("/gigya/accounts.getJWT", self._gigya_jwt)
+        app.router.add_get(
+            "/commerce/v1/persons/{person_id}", self._kamereon_person
+        )
+        app.router.add_get(
+            "/commerce/v1/accounts/{account_id}/vehicles", self._kamereon_vehicles
+        )
+        app.router.add_route("*", _ROUTE, self._kamereon_vehicle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}"
+
+    async def _async_stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _delay(self) -> None:
+        config = self.config
+        if delay := config.latency + self._random.uniform(0, config.jitter):
+            await asyncio.sleep(delay)
+
+    async def _gigya_login(self, request: web.Request) -> web.Response:
+        self.stats.requests["gigya/login"] += 1
+        await self._delay()
+        return _json(
+            {"errorCode": 0, "sessionInfo": {"cookieValue": "benchmark-cookie"}}
+        )
+
+    async def _gigya_account(self, request: web.Request) -> web.Response:
+        self.stats.requests["gigya/account"] += 1
+        await self._delay()
+        return _json({"errorCode": 0, "data": {"personId": PERSON_ID}})
+
+    async def _gigya_jwt(self, request: web.Request) -> web.Response:
+        self.stats.requests["gigya/jwt"] += 1
+        await self._delay()
+        return _json({"errorCode": 0, "id_token": self._jwt})
+
+    async def _kamereon_person(self, request: web.Request) -> web.Response:
+        self.stats.requests["person"] += 1
+        await self._delay()
+        return _json(
+            {
+                "personId": PERSON_ID,
+                "accounts": [
+                    {
+                        "accountId": ACCOUNT_ID,
+                        "accountType": "MYRENAULT",
+                        "accountStatus": "ACTIVE",
+                    }
+                ],
+            }
+        )
+
+    async def _kamereon_vehicles(self, request: web.Request) -> web.Response:
+        self.stats.requests["vehicles"] += 1
+        await self._delay()
+        return _json(
+            {
+                "accountId": ACCOUNT_ID,
+                "country": "FR",
+                "vehicleLinks": [
+                    {
+                        "vin": vin,
+                        "vehicleDetails": {
+                            "vin": vin,
+                            "registrationNumber": f"BENCH-{index}",
+                            "brand": {"label": "RENAULT"},
+                            "model": {
+                                "code": MODEL_CODE,
+                                "label": "ZOE",
+                                "group": "971",
+                            },
+                            "energy": {"code": "ELEC", "label": "ELECTRIQUE"},
+                            "engineEnergyType": "ELEC",
+                            "assets": [],
+                        },
+                    }
+                    for index, vin in enumerate(self._vins)
+                ],
+            }
+        )
+
+    async def _kamereon_vehicle(self, request: web.Request) -> web.Response:
+        endpoint = request.match_info["endpoint"].removeprefix("ev/")
+        vin = request.match_info["vin"]
+        kind = "actions" if request.method == "POST" else endpoint
+        self.stats.requests[kind] += 1
+        await self._delay()
+        if self._random.random() < self.config.throttle_rate:
+            self.stats.throttled += 1
+            return _error(429, "err.func.wired.overloaded", "Quota exceeded")
+        if request.method == "POST":
+            self.stats.actions.append((endpoint, await request.json()))
+            return _json(
+                {"data": {"type": "Action", "id": "benchmark", "attributes": {}}}
+            )
+        if endpoint not in self._supported or vin not in self._vins:
+            return _error(501, "err.tech.501", "This feature is not supported")
+        key = (vin, endpoint)
+        version = self._versions.get(key, 0)
+        if self._random.random() < self.config.change_rate:
+            version = self._versions[key] = version + 1
+        attributes = _get_attributes(endpoint, version)
+        if endpoint in _RAW_ENDPOINTS:
+            return _json(attributes)
+        return _json({"data": {"type": "Car", "id": vin, "attributes": attributes}})
+
+
+def _json(body: dict[str, Any]) -> web.Response:
+    return web.Response(text=json.dumps(body), content_type="application/json")
+
+
+def _error(status: int, code: str, message: str) -> web.Response:
+    return web.Response(
+        status=status,
+        text=json.dumps({"errors": [{"errorCode": code, "errorMessage": message}]}),
+        content_type="application/json",
+    )
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Fleet-scale scenario: the benchmark at 10, 100 and 500 vehicles per account.
+
+Each fleet size runs run.py in its own process, so that the peak memory of a
+size does not hide the next one. The hourly call budget grows with the fleet,
+as the one of the integration is sized for a few vehicles: with it, the first
+refreshes of 500 vehicles alone would take days.
+
+Reported for each size: setup duration, peak RSS, event loop lag, and the age
+of the oldest data of each vehicle at the end of the steady state.
+
+Usage:
+    python benchmarks/fleet.py
+    python benchmarks/fleet.py --sizes 10 100 --duration 120 --latency 0.02
+
+Other arguments are passed to run.py.
+"""
+
+import argparse
+import json
+from pathlib import Path
+import subprocess
+import sys
+from typing import Any
+
+RUN_PATH = Path(__file__).resolve().parent / "run.py"
+
+COLUMNS = (
+    ("vehicles", lambda report: report["arguments"]["vehicles"]),
+    ("setup_s", lambda report: report["setup"]["seconds"]),
+    ("peak_rss_mib", lambda report: report["steady"]["memory"]["peak_rss_mib"]),
+    ("setup_lag_max_ms", lambda report: report["setup"]["loop_lag"]["max_ms"]),
+    ("calls_per_hour", lambda report: report["steady"]["calls_per_hour"]),
+    ("fresh_p50_s", lambda report: report["steady"]["freshness"]["p50_seconds"]),
+    ("fresh_max_s", lambda report: report["steady"]["freshness"]["max_seconds"]),
+    ("never_fetched", lambda report: report["steady"]["freshness"]["never_fetched"]),
+)
+
+
+def run_size(
+    vehicles: int, args: argparse.Namespace, extra: list[str]
+) -> dict[str, Any]:
+    """Run the benchmark for a fleet size, in its own process."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            str(RUN_PATH),
+            "--json",
+            "--vehicles",
+            str(vehicles),
+            "--calls-per-hour",
+            str(vehicles * args.calls_per_vehicle),
+            "--duration",
+            str(args.duration),
+            "--latency",
+            str(args.latency),
+            *extra,
+        ],
+        check=True,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    """Run the fleet sizes from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 500], help="fleet sizes"
+    )
+    parser.add_argument(
+        "--calls-per-vehicle",
+        type=int,
+        default=120,
+        help="hourly call budget of the account, per vehicle",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=300.0,
+        help="steady state measured after the setup, in seconds",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="server latency, in seconds"
+    )
+    parser.add_argument("--json", action="store_true", help="print a JSON report")
+    args, extra = parser.parse_known_args()
+
+    reports = []
+    for vehicles in args.sizes:
+        reports.append(run_size(vehicles, args, extra))
+        if not args.json:
+            if len(reports) == 1:
+                print(" ".join(f"{name:>16}" for name, _ in COLUMNS))
+            print(" ".join(f"{str(value(reports[-1])):>16}" for _, value in COLUMNS))
+    if args.json:
+        print(json.dumps(reports, indent=2))
+
+
+if __name__ == "__main__":
+    main()
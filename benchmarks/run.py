@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""Benchmark the Renault integration against the fake Kamereon servers.
+
+The integration is set up in a throwaway Home Assistant instance, against a
+local stand-in of the Renault servers (see fake_kamereon.py), then left
+polling for a while. Reported:
+
+- setup: time to set up the config entry, until all the entities are added
+- calls per hour: Kamereon calls in the steady state, after the setup
+- event loop lag: how late a periodic probe runs on the Home Assistant loop
+- state writes: entity states written by the integration
+- memory: peak RSS of the process, and Python allocations with --tracemalloc
+- freshness: age of the oldest data of each vehicle, at the end of the run
+
+This is not a test suite: compare the reports of two trees, with the same
+arguments and seed, to see the cost of a change.
+
+Usage:
+    python benchmarks/run.py --vehicles 5 --duration 600
+    python benchmarks/run.py --throttle-rate 0.05 --latency 0.5 --json
+"""
+
+import argparse
+import asyncio
+from collections.abc import Mapping
+import json
+import os
+from pathlib import Path
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import MappingProxyType
+from typing import Any
+
+from fake_kamereon import (
+    ACCOUNT_ID,
+    DATA_ENDPOINTS,
+    FakeKamereonConfig,
+    FakeKamereonServer,
+)
+from renault_api import renault_session
+
+from homeassistant import bootstrap, loader
+from homeassistant.config_entries import (
+    SOURCE_USER,
+    ConfigEntries,
+    ConfigEntry,
+    ConfigEntryState,
+)
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    EVENT_STATE_CHANGED,
+    EVENT_STATE_REPORTED,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core_config import async_process_ha_core_config
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+
+DOMAIN = "renault"
+REPO_DIR = Path(__file__).resolve().parent.parent
+CORE_CONFIG = {
+    "name": "Renault benchmark",
+    "latitude": 48.85,
+    "longitude": 2.35,
+    "elevation": 35,
+    "unit_system": "metric",
+    "time_zone": "Europe/Paris",
+}
+
+
+class LoopLagProbe:
+    """Measure how late the event loop runs a periodic callback."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, interval: float) -> None:
+        """Initialise probe."""
+        self._loop = loop
+        self._interval = interval
+        self._expected = 0.0
+        self._handle: asyncio.TimerHandle | None = None
+        self.samples: list[float] = []
+
+    def start(self) -> None:
+        """Start probing."""
+        self._expected = self._loop.time() + self._interval
+        self._handle = self._loop.call_at(self._expected, self._run)
+
+    def stop(self) -> None:
+        """Stop probing."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _run(self) -> None:
+        now = self._loop.time()
+        self.samples.append(now - self._expected)
+        self._expected = now + self._interval
+        self._handle = self._loop.call_at(self._expected, self._run)
+
+    def pop_summary(self) -> dict[str, float | None]:
+        """Return the lag since the last summary, in milliseconds."""
+        samples = sorted(self.samples)
+        self.samples = []
+        if not samples:
+            return {"mean_ms": None, "p99_ms": None, "max_ms": None}
+        return {
+            "mean_ms": round(1000 * sum(samples) / len(samples), 2),
+            "p99_ms": round(1000 * samples[int(0.99 * (len(samples) - 1))], 2),
+            "max_ms": round(1000 * samples[-1], 2),
+        }
+
+
+class StateWriteCounter:
+    """Count the states written by the entities of the integration."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise counter."""
+        self._registry = er.async_get(hass)
+        # platform of each entity id seen, to keep the filter cheap
+        self._platforms: dict[str, str | None] = {}
+        self.changed = 0
+        self.reported = 0
+        self._unsubs = [
+            hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._on_changed, self._is_renault
+            ),
+            hass.bus.async_listen(
+                EVENT_STATE_REPORTED, self._on_reported, self._is_renault
+            ),
+        ]
+
+    @callback
+    def _is_renault(self, event_data: Mapping[str, Any]) -> bool:
+        entity_id: str = event_data["entity_id"]
+        if (platform := self._platforms.get(entity_id)) is None:
+            entry = self._registry.async_get(entity_id)
+            platform = self._platforms[entity_id] = entry.platform if entry else ""
+        return platform == DOMAIN
+
+    @callback
+    def _on_changed(self, _event: Event) -> None:
+        self.changed += 1
+
+    @callback
+    def _on_reported(self, _event: Event) -> None:
+        self.reported += 1
+
+    def stop(self) -> None:
+        """Stop counting."""
+        for unsub in self._unsubs:
+            unsub()
+
+    def pop_summary(self) -> dict[str, int]:
+        """Return the writes since the last summary."""
+        summary = {
+            "changed": self.changed,
+            "unchanged": self.reported,
+            "total": self.changed + self.reported,
+        }
+        self.changed = self.reported = 0
+        return summary
+
+
+def _get_memory() -> dict[str, float | None]:
+    """Return the peak RSS, and the traced Python allocations, in MiB."""
+    # ru_maxrss is in KiB on Linux, in bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        maxrss //= 1024
+    memory: dict[str, float | None] = {
+        "peak_rss_mib": round(maxrss / 1024, 1),
+        "traced_mib": None,
+        "traced_peak_mib": None,
+    }
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        memory["traced_mib"] = round(current / 2**20, 1)
+        memory["traced_peak_mib"] = round(peak / 2**20, 1)
+    return memory
+
+
+def _patch_locale(server: FakeKamereonServer) -> None:
+    """Point renault-api to the fake servers, whatever the locale."""
+
+    async def _async_get_api_keys(*args: Any, **kwargs: Any) -> dict[str, str]:
+        return server.locale_details
+
+    renault_session.get_api_keys = _async_get_api_keys
+
+
+async def _async_set_budget(hass: HomeAssistant, calls_per_hour: int) -> None:
+    """Replace the hourly call budget of the integration, for large fleets."""
+    integration = await loader.async_get_integration(hass, DOMAIN)
+    await integration.async_get_component()
+    sys.modules[f"{integration.pkg_path}.renault_hub"].MAX_CALLS_PER_HOURS = (
+        calls_per_hour
+    )
+
+
+def _get_freshness(entry: ConfigEntry) -> dict[str, float | int | None]:
+    """Return the age of the oldest data of each vehicle, over the vehicles."""
+    now = time.monotonic()
+    ages: list[float] = []
+    never_fetched = 0
+    for vehicle in entry.runtime_data.vehicles.values():
+        fetched = [
+            coordinator.fetched_at for coordinator in vehicle.coordinators.values()
+        ]
+        if not fetched or None in fetched:
+            never_fetched += 1
+            continue
+        ages.append(now - min(fetched))
+    ages.sort()
+    return {
+        "vehicles": len(ages) + never_fetched,
+        "never_fetched": never_fetched,
+        "p50_seconds": round(ages[len(ages) // 2], 1) if ages else None,
+        "max_seconds": round(ages[-1], 1) if ages else None,
+    }
+
+
+async def async_start_hass(config_dir: str) -> HomeAssistant:
+    """Start a bare Home Assistant, with the integration as custom component."""
+    os.symlink(REPO_DIR / "custom_components", Path(config_dir, "custom_components"))
+    hass = HomeAssistant(config_dir)
+    loader.async_setup(hass)
+    hass.config_entries = ConfigEntries(hass, {})
+    await loader.async_get_custom_components(hass)
+    await bootstrap.async_load_base_functionality(hass)
+    await async_process_ha_core_config(hass, CORE_CONFIG)
+    # network is needed by the resolver of the shared aiohttp session
+    for domain in ("homeassistant", "network"):
+        if not await async_setup_component(hass, domain, {}):
+            raise RuntimeError(f"Unable to set up {domain}")
+    await hass.async_start()
+    return hass
+
+
+def create_entry(
+    title: str = "Benchmark", options: Mapping[str, Any] | None = None
+) -> ConfigEntry:
+    """Return a config entry for the fake account."""
+    return ConfigEntry(
+        data={
+            "locale": "fr_FR",
+            CONF_USERNAME: "benchmark@example.com",
+            CONF_PASSWORD: "benchmark",
+            "kamereon_account_id": ACCOUNT_ID,
+        },
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        minor_version=1,
+        options=options or {},
+        source=SOURCE_USER,
+        subentries_data=None,
+        title=title,
+        unique_id=ACCOUNT_ID,
+        version=1,
+    )
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, options: Mapping[str, Any] | None = None
+) -> tuple[ConfigEntry, float]:
+    """Set up the integration, and return its entry and the setup duration."""
+    entry = create_entry(options=options)
+    start = time.perf_counter()
+    await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+    duration = time.perf_counter() - start
+    if entry.state is not ConfigEntryState.LOADED:
+        raise RuntimeError(f"Setup failed: {entry.state} {entry.reason}")
+    return entry, duration
+
+
+async def async_run(
+    args: argparse.Namespace,
+    config_dir: str,
+) -> dict[str, Any]:
+    """Run the benchmark and return its report."""
+    server = FakeKamereonServer(
+        FakeKamereonConfig(
+            vehicles=args.vehicles,
+            endpoints=args.endpoints,
+            latency=args.latency,
+            jitter=args.jitter,
+            throttle_rate=args.throttle_rate,
+            change_rate=args.change_rate,
+            seed=args.seed,
+        )
+    )
+    server.start()
+    _patch_locale(server)
+    if args.tracemalloc:
+        tracemalloc.start()
+    try:
+        hass = await async_start_hass(config_dir)
+        if args.calls_per_hour is not None:
+            await _async_set_budget(hass, args.calls_per_hour)
+        probe = LoopLagProbe(hass.loop, args.probe_interval)
+        writes = StateWriteCounter(hass)
+        probe.start()
+
+        entry, setup_seconds = await async_setup_entry(
+            hass, {"batch_vehicle_updates": args.batch_vehicle_updates}
+        )
+        setup_calls = server.stats.data_calls
+        setup_throttled = server.stats.throttled
+        report: dict[str, Any] = {
+            "arguments": vars(args),
+            "setup": {
+                "seconds": round(setup_seconds, 3),
+                "requests": server.stats.snapshot(),
+                "throttled": setup_throttled,
+                "loop_lag": probe.pop_summary(),
+                "state_writes": writes.pop_summary(),
+                "memory": _get_memory(),
+            },
+        }
+
+        await asyncio.sleep(args.duration)
+        steady_calls = server.stats.data_calls - setup_calls
+        report["steady"] = {
+            "seconds": args.duration,
+            "calls": steady_calls,
+            "calls_per_hour": round(steady_calls * 3600 / args.duration, 1),
+            "throttled": server.stats.throttled - setup_throttled,
+            "loop_lag": probe.pop_summary(),
+            "state_writes": writes.pop_summary(),
+            "memory": _get_memory(),
+            "freshness": _get_freshness(entry),
+        }
+
+        probe.stop()
+        writes.stop()
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_stop()
+    finally:
+        tracemalloc.stop()
+        server.stop()
+    return report
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Return the parser of the benchmark arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicles", type=int, default=1, help="vehicles (N)")
+    parser.add_argument(
+        "--endpoints",
+        type=int,
+        default=len(DATA_ENDPOINTS),
+        choices=range(1, len(DATA_ENDPOINTS) + 1),
+        metavar=f"1-{len(DATA_ENDPOINTS)}",
+        help="supported data endpoints per vehicle (M)",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.1, help="server latency, in seconds"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="random extra latency, in seconds"
+    )
+    parser.add_argument(
+        "--throttle-rate",
+        type=float,
+        default=0.0,
+        help="ratio of Kamereon calls refused with a quota error (429)",
+    )
+    parser.add_argument(
+        "--change-rate",
+        type=float,
+        default=0.3,
+        help="probability that the data of an endpoint changed since the last call",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=600.0,
+        help="steady state measured after the setup, in seconds",
+    )
+    parser.add_argument(
+        "--probe-interval",
+        type=float,
+        default=0.05,
+        help="interval of the event loop lag probe, in seconds",
+    )
+    parser.add_argument(
+        "--calls-per-hour",
+        type=int,
+        help="hourly call budget of the account, instead of the integration one",
+    )
+    parser.add_argument(
+        "--batch-vehicle-updates",
+        action="store_true",
+        help="refresh the endpoints of each vehicle in one batch cycle",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="trace Python allocations, slows the run down",
+    )
+    parser.add_argument("--json", action="store_true", help="print a JSON report")
+    return parser
+
+
+def print_report(report: Mapping[str, Any], indent: int = 0) -> None:
+    """Print a report as an indented list."""
+    for key, value in report.items():
+        if isinstance(value, Mapping):
+            print(f"{' ' * indent}{key}:")
+            print_report(value, indent + 2)
+        else:
+            print(f"{' ' * indent}{key}: {value}")
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    args = get_parser().parse_args()
+    with tempfile.TemporaryDirectory(prefix="renault-benchmark-") as config_dir:
+        report = asyncio.run(async_run(args, config_dir))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
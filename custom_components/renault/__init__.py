@@ -10,9 +10,10 @@ from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.typing import ConfigType
 
-from .const import CONF_LOCALE, DOMAIN, PLATFORMS
+from .const import CONF_KAMEREON_ACCOUNT_ID, CONF_LOCALE, DOMAIN, PLATFORMS
 from .renault_hub import RenaultHub
 from .services import async_setup_services
+from .storage import async_pop_caches
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 type RenaultConfigEntry = ConfigEntry[RenaultHub]
@@ -29,24 +30,34 @@ async def async_setup_entry(
 ) -> bool:
     """Load a config entry."""
     renault_hub = RenaultHub(hass, config_entry.data[CONF_LOCALE])
-    try:
-        login_success = await renault_hub.attempt_login(
-            config_entry.data[CONF_USERNAME], config_entry.data[CONF_PASSWORD]
-        )
-    except (aiohttp.ClientConnectionError, GigyaException) as exc:
-        raise ConfigEntryNotReady from exc
-
-    if not login_success:
-        raise ConfigEntryAuthFailed
+    await renault_hub.async_load_caches(config_entry)
+
+    if renault_hub.has_cached_vehicles(config_entry):
+        # Vehicles are known, do not wait for the servers to set up the entities
+        renault_hub.async_start_login(config_entry)
+    else:
+        try:
+            login_success = await renault_hub.attempt_login(
+                config_entry.data[CONF_USERNAME], config_entry.data[CONF_PASSWORD]
+            )
+        except (aiohttp.ClientConnectionError, GigyaException) as exc:
+            raise ConfigEntryNotReady from exc
+
+        if not login_success:
+            raise ConfigEntryAuthFailed
 
     try:
         await renault_hub.async_initialise(config_entry)
     except aiohttp.ClientError as exc:
         raise ConfigEntryNotReady from exc
+    # calls made during the setup waited for the background login, if any
+    renault_hub.raise_on_login_failure()
 
     config_entry.runtime_data = renault_hub
 
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    # the entities have subscribed to their coordinators by now
+    renault_hub.async_start_cached_refresh(config_entry)
 
     return True
 
@@ -58,10 +69,24 @@ async def async_unload_entry(
     return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
 
 
+async def async_remove_entry(
+    hass: HomeAssistant, config_entry: RenaultConfigEntry
+) -> None:
+    """Remove the caches of a config entry."""
+    await async_pop_caches(hass, config_entry.entry_id).async_remove()
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant, config_entry: RenaultConfigEntry, device_entry: dr.DeviceEntry
 ) -> bool:
-    """Remove a config entry from a device."""
+    """Remove a config entry from a device.
+
+    The devices of the current vehicles, and the one of the account, which
+    holds its diagnostic sensors, are kept.
+    """
     return not device_entry.identifiers.intersection(
-        (DOMAIN, vin) for vin in config_entry.runtime_data.vehicles
+        [
+            (DOMAIN, config_entry.data[CONF_KAMEREON_ACCOUNT_ID]),
+            *((DOMAIN, vin) for vin in config_entry.runtime_data.vehicles),
+        ]
     )
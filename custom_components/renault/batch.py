@@ -0,0 +1,118 @@
+"""Refresh of all the coordinators of a Renault vehicle in one cycle."""
+
+import asyncio
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import BATCH_MAX_CONCURRENCY, DOMAIN
+
+if TYPE_CHECKING:
+    from . import RenaultConfigEntry
+    from .coordinator import RenaultDataUpdateCoordinator
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RenaultBatchUpdater:
+    """Refresh all the active coordinators of a vehicle on a single timer.
+
+    The coordinators are fetched with bounded concurrency, and their listeners
+    are only notified once all of them are done, so the entities of the
+    vehicle are written together once per cycle.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: RenaultConfigEntry,
+        name: str,
+        coordinators: Mapping[str, RenaultDataUpdateCoordinator],
+    ) -> None:
+        """Initialise batch updater."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._name = name
+        self._coordinators = coordinators
+        self._unsub: CALLBACK_TYPE | None = None
+        self.interval: timedelta | None = None
+        self.last_cycle: datetime | None = None
+        config_entry.async_on_unload(self.async_stop)
+
+    def update_interval(self) -> None:
+        """Set the cycle to spend the same calls as the coordinator intervals.
+
+        Each cycle calls every coordinator, so the cycle interval is the
+        harmonic mean of the coordinator intervals. The cycles start once a
+        coordinator is polled, as the entities subscribe after the setup,
+        and stop when none is.
+        """
+        intervals = [
+            coordinator.update_interval.total_seconds()
+            for coordinator in self._coordinators.values()
+            if coordinator.is_polled and coordinator.update_interval is not None
+        ]
+        if not intervals:
+            self.interval = None
+            self.async_stop()
+            return
+        stopped = self.interval is None
+        self.interval = timedelta(
+            seconds=len(intervals) / sum(1 / interval for interval in intervals)
+        )
+        if stopped:
+            self.async_start()
+
+    @callback
+    def async_start(self, phase: float = 1.0) -> None:
+        """Schedule the next cycle at a fraction of the interval from now."""
+        self.async_stop()
+        if self.interval is None:
+            return
+        self._unsub = async_call_later(
+            self._hass, self.interval * phase, self._async_on_timer
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the next cycle."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_on_timer(self, _now: datetime) -> None:
+        """Run a cycle in the background."""
+        self._unsub = None
+        self._config_entry.async_create_background_task(
+            self._hass, self._async_run_cycle(), f"{DOMAIN} batch {self._name}"
+        )
+
+    async def _async_run_cycle(self) -> None:
+        """Refresh the polled coordinators, then notify their listeners."""
+        coordinators = [
+            coordinator
+            for coordinator in self._coordinators.values()
+            if coordinator.is_polled
+        ]
+        semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+
+        async def _async_refresh(coordinator: RenaultDataUpdateCoordinator) -> None:
+            async with semaphore:
+                await coordinator.async_refresh()
+
+        for coordinator in coordinators:
+            coordinator.async_hold_listeners()
+        try:
+            await asyncio.gather(*map(_async_refresh, coordinators))
+        finally:
+            for coordinator in coordinators:
+                coordinator.async_release_listeners()
+            self.last_cycle = dt_util.utcnow()
+            self.async_start()
+        LOGGER.debug("Refreshed %s coordinators of %s", len(coordinators), self._name)
@@ -0,0 +1,236 @@
+"""Correction of the battery level of models wrongly reporting a full battery."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+import logging
+from typing import Any
+
+from renault_api.kamereon.enums import ChargeState, PlugState
+from renault_api.kamereon.models import KamereonVehicleBatteryStatusData
+
+from homeassistant.util import dt as dt_util
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class BatteryProfile:
+    """Battery of a model, to tell a wrong full battery level from a real one."""
+
+    capacity_kwh: float
+    max_charge_power_kw: float
+    # at a full level, an autonomy above this is trusted
+    trusted_full_autonomy_km: int
+    # at a full level, an autonomy below this is not possible
+    min_full_autonomy_km: int
+
+
+# Models known to report a full battery while it is not, by model code
+BATTERY_PROFILES: dict[str, BatteryProfile] = {
+    # TWINGO III: single 22 kWh battery, charged at up to 22 kW
+    "X071VE": BatteryProfile(
+        capacity_kwh=22,
+        max_charge_power_kw=22,
+        trusted_full_autonomy_km=150,
+        min_full_autonomy_km=130,
+    ),
+}
+
+
+class BatteryPhase(StrEnum):
+    """Phase of the battery level correction."""
+
+    # the last level was below full
+    BELOW_FULL = "below_full"
+    # full, and no reason to doubt it yet
+    FULL_UNCONFIRMED = "full_unconfirmed"
+    # full, and confirmed by the autonomy or the end of a charge
+    FULL = "full"
+    # full, but rejected at least once since the level was below full
+    FULL_REJECTED = "full_rejected"
+
+
+class BatteryLevelCorrection:
+    """Battery level of a vehicle, with the wrong full levels removed.
+
+    Some models report a full battery at random, with an unchanged autonomy
+    and no charge in progress. A full level is only trusted with a matching
+    autonomy or at the end of a charge, and is otherwise checked against the
+    last level below full, the charge status and the battery profile. A
+    rejected full level is shown as unknown, or as the last level below full
+    when the autonomy did not change since.
+
+    The correction runs once per payload, and its state is kept across
+    restarts.
+    """
+
+    __slots__ = (
+        "below_full_at",
+        "below_full_autonomy",
+        "below_full_level",
+        "charged_while_full",
+        "level",
+        "phase",
+        "profile",
+        "status",
+        "value",
+        "vin",
+    )
+
+    def __init__(self, profile: BatteryProfile, vin: str) -> None:
+        """Initialise correction."""
+        self.profile = profile
+        self.vin = vin
+        self.phase = BatteryPhase.BELOW_FULL
+        # last level and available charge status received
+        self.level: int | None = None
+        self.status: ChargeState | None = None
+        # last level below full, with its autonomy and time
+        self.below_full_level: int | None = None
+        self.below_full_autonomy: float | None = None
+        self.below_full_at: datetime | None = None
+        self.charged_while_full = False
+        # corrected level of the last payload
+        self.value: int | None = None
+
+    def update(self, data: KamereonVehicleBatteryStatusData, now: datetime) -> None:
+        """Correct the level of a new payload."""
+        if (level := data.batteryLevel) is None:
+            self.value = None
+            return
+        charging_status = data.get_charging_status() or ChargeState.UNAVAILABLE
+        if data.plugStatus == 3:
+            # reported by these models while plugged
+            plug_status = PlugState.PLUGGED
+        else:
+            plug_status = data.get_plug_status() or PlugState.PLUG_UNKNOWN
+
+        if level < 100:
+            self.phase = BatteryPhase.BELOW_FULL
+            self.below_full_level = level
+            self.below_full_autonomy = data.batteryAutonomy
+            self.below_full_at = now
+            self.charged_while_full = False
+            self.value = level
+        else:
+            self.value = self._check_full(
+                level, data.batteryAutonomy, charging_status, plug_status, now
+            )
+
+        if charging_status is not ChargeState.UNAVAILABLE:
+            self.status = charging_status
+        self.level = level
+
+    def _check_full(
+        self,
+        level: int,
+        autonomy: float | None,
+        charging_status: ChargeState,
+        plug_status: PlugState,
+        now: datetime,
+    ) -> int | None:
+        """Return the full level, or its correction if it is wrong."""
+        profile = self.profile
+        if (
+            autonomy is not None and autonomy >= profile.trusted_full_autonomy_km
+        ) or ChargeState.CHARGE_ENDED in (charging_status, self.status):
+            self.phase = BatteryPhase.FULL
+            return level
+        if self.phase is BatteryPhase.FULL:
+            return level
+
+        reason: str | None = None
+        if (
+            charging_status
+            in (ChargeState.WAITING_FOR_CURRENT_CHARGE, ChargeState.UNAVAILABLE)
+            or plug_status is PlugState.PLUG_UNKNOWN
+        ):
+            reason = f"charging status {charging_status.name}, plug {plug_status.name}"
+        elif (
+            self.below_full_level is not None
+            and self.below_full_at is not None
+            and (hours := (now - self.below_full_at).total_seconds() / 3600) > 0
+            and (level - self.below_full_level) / 100 * profile.capacity_kwh / hours
+            > profile.max_charge_power_kw
+        ):
+            reason = f"charged too fast from {self.below_full_level}%"
+        elif (
+            self.level is not None
+            and self.level < 100
+            and ChargeState.CHARGE_IN_PROGRESS not in (charging_status, self.status)
+        ):
+            reason = "full without charging"
+        elif autonomy is None or autonomy < profile.min_full_autonomy_km:
+            reason = f"autonomy {autonomy}km"
+
+        if ChargeState.CHARGE_IN_PROGRESS in (charging_status, self.status):
+            self.charged_while_full = True
+
+        value: int | None = level
+        if reason is not None:
+            LOGGER.warning("Ignoring full battery level of %s: %s", self.vin, reason)
+            self.phase = BatteryPhase.FULL_REJECTED
+            value = None
+        elif self.phase is BatteryPhase.FULL_REJECTED:
+            # full is possible again only after a charge
+            if not self.charged_while_full:
+                value = None
+        else:
+            self.phase = BatteryPhase.FULL_UNCONFIRMED
+
+        if (
+            autonomy is not None
+            and self.below_full_autonomy is not None
+            and int(autonomy) == int(self.below_full_autonomy)
+        ):
+            # the autonomy did not move since the last level below full
+            LOGGER.warning(
+                "Using last battery level of %s, %s%%, as the autonomy is unchanged",
+                self.vin,
+                self.below_full_level,
+            )
+            value = self.below_full_level
+        return value
+
+    @property
+    def has_state(self) -> bool:
+        """Return True if a payload was corrected already."""
+        return self.level is not None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the correction, to be stored."""
+        return {
+            "phase": self.phase.value,
+            "level": self.level,
+            "status": None if self.status is None else self.status.value,
+            "below_full_level": self.below_full_level,
+            "below_full_autonomy": self.below_full_autonomy,
+            "below_full_at": (
+                None if self.below_full_at is None else self.below_full_at.isoformat()
+            ),
+            "charged_while_full": self.charged_while_full,
+            "value": self.value,
+        }
+
+    def restore(self, state: dict[str, Any]) -> None:
+        """Restore the stored state of the correction, ignoring invalid states."""
+        try:
+            phase = BatteryPhase(state["phase"])
+            status = None if state["status"] is None else ChargeState(state["status"])
+            below_full_at = (
+                None
+                if state["below_full_at"] is None
+                else dt_util.parse_datetime(state["below_full_at"])
+            )
+        except (KeyError, TypeError, ValueError) as err:
+            LOGGER.debug("Ignoring stored battery correction of %s: %s", self.vin, err)
+            return
+        self.phase = phase
+        self.level = state.get("level")
+        self.status = status
+        self.below_full_level = state.get("below_full_level")
+        self.below_full_autonomy = state.get("below_full_autonomy")
+        self.below_full_at = below_full_at
+        self.charged_while_full = bool(state.get("charged_while_full"))
+        self.value = state.get("value")
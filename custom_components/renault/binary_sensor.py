@@ -16,11 +16,13 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from . import RenaultConfigEntry
 from .entity import RenaultDataEntity, RenaultDataEntityDescription
+from .entity_plan import has_coordinator
 
 # Coordinator is used to centralize the data updates
 PARALLEL_UPDATES = 0
@@ -55,8 +57,9 @@ async def async_setup_entry(
     entities: list[RenaultBinarySensor] = [
         RenaultBinarySensor(vehicle, description)
         for vehicle in config_entry.runtime_data.vehicles.values()
-        for description in BINARY_SENSOR_TYPES
-        if description.coordinator in vehicle.coordinators
+        for description in vehicle.entity_plan.get_descriptions(
+            vehicle, Platform.BINARY_SENSOR, BINARY_SENSOR_TYPES, has_coordinator
+        )
     ]
     async_add_entities(entities)
 
@@ -71,7 +74,7 @@ class RenaultBinarySensor[T: KamereonVehicleDataAttributes](
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        return self.entity_description.value_lambda(self)
+        return self._get_derived_value(self.entity_description.value_lambda)
 
 
 def _plugged_in_value_lambda(
@@ -93,12 +96,14 @@ BINARY_SENSOR_TYPES: tuple[RenaultBinarySensorEntityDescription, ...] = (
     RenaultBinarySensorEntityDescription[KamereonVehicleBatteryStatusData](
         key="plugged_in",
         coordinator="battery",
+        source_fields=("plugStatus", "chargingStatus"),
         device_class=BinarySensorDeviceClass.PLUG,
         value_lambda=_plugged_in_value_lambda,
     ),
     RenaultBinarySensorEntityDescription[KamereonVehicleBatteryStatusData](
         key="charging",
         coordinator="battery",
+        source_fields=("chargingStatus",),
         device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
         value_lambda=lambda e: (
             e.coordinator.data.chargingStatus == ChargeState.CHARGE_IN_PROGRESS.value
@@ -109,6 +114,7 @@ BINARY_SENSOR_TYPES: tuple[RenaultBinarySensorEntityDescription, ...] = (
     RenaultBinarySensorEntityDescription[KamereonVehicleHvacStatusData](
         key="hvac_status",
         coordinator="hvac_status",
+        source_fields=("hvacStatus",),
         translation_key="hvac_status",
         value_lambda=lambda e: (
             e.coordinator.data.hvacStatus == "on"
@@ -119,6 +125,7 @@ BINARY_SENSOR_TYPES: tuple[RenaultBinarySensorEntityDescription, ...] = (
     RenaultBinarySensorEntityDescription[KamereonVehicleLockStatusData](
         key="lock_status",
         coordinator="lock_status",
+        source_fields=("lockStatus",),
         # lock: on means open (unlocked), off means closed (locked)
         device_class=BinarySensorDeviceClass.LOCK,
         value_lambda=lambda e: (
@@ -130,6 +137,7 @@ BINARY_SENSOR_TYPES: tuple[RenaultBinarySensorEntityDescription, ...] = (
     RenaultBinarySensorEntityDescription[KamereonVehicleLockStatusData](
         key="hatch_status",
         coordinator="lock_status",
+        source_fields=("hatchStatus",),
         # On means open, Off means closed
         device_class=BinarySensorDeviceClass.DOOR,
         translation_key="hatch_status",
@@ -142,6 +150,7 @@ BINARY_SENSOR_TYPES: tuple[RenaultBinarySensorEntityDescription, ...] = (
     RenaultBinarySensorEntityDescription[KamereonVehicleLockStatusData](
         key="rear_left_door_status",
         coordinator="lock_status",
+        source_fields=("doorStatusRearLeft",),
         # On means open, Off means closed
         device_class=BinarySensorDeviceClass.DOOR,
         translation_key="rear_left_door_status",
@@ -154,6 +163,7 @@ BINARY_SENSOR_TYPES: tuple[RenaultBinarySensorEntityDescription, ...] = (
     RenaultBinarySensorEntityDescription[KamereonVehicleLockStatusData](
         key="rear_right_door_status",
         coordinator="lock_status",
+        source_fields=("doorStatusRearRight",),
         # On means open, Off means closed
         device_class=BinarySensorDeviceClass.DOOR,
         translation_key="rear_right_door_status",
@@ -166,6 +176,7 @@ BINARY_SENSOR_TYPES: tuple[RenaultBinarySensorEntityDescription, ...] = (
     RenaultBinarySensorEntityDescription[KamereonVehicleLockStatusData](
         key="driver_door_status",
         coordinator="lock_status",
+        source_fields=("doorStatusDriver",),
         # On means open, Off means closed
         device_class=BinarySensorDeviceClass.DOOR,
         translation_key="driver_door_status",
@@ -178,6 +189,7 @@ BINARY_SENSOR_TYPES: tuple[RenaultBinarySensorEntityDescription, ...] = (
     RenaultBinarySensorEntityDescription[KamereonVehicleLockStatusData](
         key="passenger_door_status",
         coordinator="lock_status",
+        source_fields=("doorStatusPassenger",),
         # On means open, Off means closed
         device_class=BinarySensorDeviceClass.DOOR,
         translation_key="passenger_door_status",
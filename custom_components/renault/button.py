@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
@@ -13,8 +14,8 @@ from .entity import RenaultEntity
 from .renault_vehicle import RenaultVehicleProxy
 
 # Coordinator is used to centralize the data updates
-# but renault servers are unreliable and it's safer to queue action calls
-PARALLEL_UPDATES = 1
+# and action calls are queued, and collapsed, by the vehicle command queue
+PARALLEL_UPDATES = 0
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -34,12 +35,20 @@ async def async_setup_entry(
     entities: list[RenaultButtonEntity] = [
         RenaultButtonEntity(vehicle, description)
         for vehicle in config_entry.runtime_data.vehicles.values()
-        for description in BUTTON_TYPES
-        if description.is_supported(vehicle)
+        for description in vehicle.entity_plan.get_descriptions(
+            vehicle, Platform.BUTTON, BUTTON_TYPES, _is_supported
+        )
     ]
     async_add_entities(entities)
 
 
+def _is_supported(
+    vehicle: RenaultVehicleProxy, description: RenaultButtonEntityDescription
+) -> bool:
+    """Check if the vehicle supports a button."""
+    return description.is_supported(vehicle)
+
+
 class RenaultButtonEntity(RenaultEntity, ButtonEntity):
     """Mixin for button specific attributes."""
 
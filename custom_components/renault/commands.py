@@ -0,0 +1,114 @@
+"""Queue of the actions sent to a Renault vehicle."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import TYPE_CHECKING, Any, cast
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .scheduler import PRIORITY_ACTION
+
+if TYPE_CHECKING:
+    from . import RenaultConfigEntry
+    from .renault_hub import RenaultHub
+
+LOGGER = logging.getLogger(__name__)
+
+
+class _Command:
+    """Action waiting to be sent, and the future shared by its callers."""
+
+    __slots__ = ("future", "send")
+
+    def __init__(
+        self, send: Callable[[], Awaitable[Any]], future: asyncio.Future[Any]
+    ) -> None:
+        """Initialise command."""
+        self.send = send
+        self.future = future
+
+
+class RenaultCommandQueue:
+    """Actions of a vehicle waiting for a slot of the hub, sent one at a time.
+
+    Actions of the same kind collapse while they wait: only the latest one is
+    sent, and all the callers get its result. Conflicting actions, such as a
+    charge start and a charge stop, share a kind, so only the last one is
+    sent, which leaves the vehicle in the same state as sending both.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: RenaultConfigEntry,
+        hub: RenaultHub,
+        name: str,
+    ) -> None:
+        """Initialise queue."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._hub = hub
+        self._name = name
+        # pending commands by kind, in the order of their first submission
+        self._pending: dict[str, _Command] = {}
+        self._worker: asyncio.Task[None] | None = None
+        self.collapsed = 0
+
+    async def async_submit[_R](
+        self, kind: str, send: Callable[[], Awaitable[_R]]
+    ) -> _R:
+        """Queue an action, replacing the pending action of the same kind."""
+        if (command := self._pending.get(kind)) is not None:
+            LOGGER.debug("Replacing pending %s action of %s", kind, self._name)
+            command.send = send
+            self.collapsed += 1
+        else:
+            command = self._pending[kind] = _Command(
+                send, self._hass.loop.create_future()
+            )
+        if self._worker is None or self._worker.done():
+            self._worker = self._config_entry.async_create_background_task(
+                self._hass, self._async_run(), f"{DOMAIN} commands {self._name}"
+            )
+        # a cancelled caller must not cancel the action of the other callers
+        return cast(_R, await asyncio.shield(command.future))
+
+    async def _async_run(self) -> None:
+        """Send the pending actions, one at a time.
+
+        When the worker is cancelled, on unload or shutdown, the actions not
+        sent yet are cancelled, so that their callers do not wait forever.
+        """
+        command: _Command | None = None
+        try:
+            while self._pending:
+                command = None
+                kind = next(iter(self._pending))
+                try:
+                    async with self._hub.async_call(
+                        f"actions/{kind}", PRIORITY_ACTION
+                    ):
+                        # take the latest action once the slot is granted
+                        command = self._pending.pop(kind)
+                        command.future.set_result(await command.send())
+                except Exception as err:  # noqa: BLE001
+                    # the error is raised to the callers of the action
+                    if command is None:
+                        command = self._pending.pop(kind)
+                    if not command.future.done():
+                        command.future.set_exception(err)
+        finally:
+            unresolved = [*self._pending.values()]
+            if command is not None:
+                unresolved.append(command)
+            self._pending.clear()
+            for pending in unresolved:
+                if not pending.future.done():
+                    pending.future.cancel()
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of actions waiting to be sent."""
+        return len(self._pending)
@@ -11,12 +11,20 @@ import voluptuous as vol
 
 from homeassistant.config_entries import (
     SOURCE_RECONFIGURE,
+    ConfigEntry,
     ConfigFlow,
     ConfigFlowResult,
+    OptionsFlowWithReload,
 )
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 
-from .const import CONF_KAMEREON_ACCOUNT_ID, CONF_LOCALE, DOMAIN
+from .const import (
+    CONF_BATCH_VEHICLE_UPDATES,
+    CONF_KAMEREON_ACCOUNT_ID,
+    CONF_LOCALE,
+    DOMAIN,
+)
 from .renault_hub import RenaultHub
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,6 +37,9 @@ USER_SCHEMA = vol.Schema(
     }
 )
 REAUTH_SCHEMA = vol.Schema({vol.Required(CONF_PASSWORD): str})
+OPTIONS_SCHEMA = vol.Schema(
+    {vol.Optional(CONF_BATCH_VEHICLE_UPDATES, default=False): bool}
+)
 
 
 class RenaultFlowHandler(ConfigFlow, domain=DOMAIN):
@@ -40,6 +51,14 @@ class RenaultFlowHandler(ConfigFlow, domain=DOMAIN):
         """Initialize the Renault config flow."""
         self.renault_config: dict[str, Any] = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: ConfigEntry,
+    ) -> RenaultOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return RenaultOptionsFlowHandler()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -151,3 +170,21 @@ class RenaultFlowHandler(ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         """Handle reconfiguration."""
         return await self.async_step_user()
+
+
+class RenaultOptionsFlowHandler(OptionsFlowWithReload):
+    """Handle Renault options, the entry is reloaded when they change."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
+        )
@@ -1,19 +1,82 @@
 """Constants for the Renault component."""
 
+from datetime import timedelta
+
 from homeassistant.const import Platform
 
 DOMAIN = "renault"
 
 CONF_LOCALE = "locale"
 CONF_KAMEREON_ACCOUNT_ID = "kamereon_account_id"
+CONF_BATCH_VEHICLE_UPDATES = "batch_vehicle_updates"
 
 # normal number of allowed calls per hour to the API
 # for a single car and the 7 coordinators, 60 is a scan every 7mn
 # We can safely bump it to 100 with the smoothing
 MAX_CALLS_PER_HOURS = 100
 
+# number of calls to the API of an account that can be in flight at the same time
+# each account gets its own scheduler, so accounts do not wait on each other
+MAX_PARALLEL_REQUESTS = 1
+
+# adaptive polling: the hourly budget is shared between the coordinators
+# according to how often their data changes between two polls
+POLLING_SMOOTHING = 0.3  # weight of the latest poll in the change rate
+POLLING_INITIAL_CHANGE_RATE = 0.5
+POLLING_MIN_WEIGHT = 0.2  # so that endpoints that never change are still polled
+POLLING_MIN_SCAN_INTERVAL_SECONDS = 60
+# while charging or conditioning, battery and hvac get a bigger share of the budget
+# and the idle endpoints a smaller one, until some time after the activity ended
+POLLING_BOOST_FACTOR = 4.0
+POLLING_IDLE_FACTOR = 0.5
+POLLING_BOOST_DURATION_SECONDS = 60 * 30
+
+# polls are deferred once this share of the hourly quota has been used
+# in the last hour, to keep some room for actions and avoid being throttled
+QUOTA_SOFT_LIMIT_RATIO = 0.9
+# calls per hour left out of the polling budget, below the soft limit, for
+# an action and the refreshes that follow it
+QUOTA_ACTION_RESERVE_CALLS = 5
+
 # If throttled time to pause the updates, in seconds
-COOLING_UPDATES_SECONDS = 60 * 15  # 15 minutes
+# doubled each time the servers still refuse calls after a pause,
+# halved each time a pause was long enough
+COOLING_UPDATES_MIN_SECONDS = 60
+COOLING_UPDATES_MAX_SECONDS = 60 * 60
+
+# with cached vehicles, the login runs in the background: delays before each
+# new attempt after a connection error, then the calls waiting for the login
+# fail, and the next call to the servers starts a new login
+LOGIN_RETRY_DELAYS_SECONDS = (5, 15, 30)
+
+# the last data of each coordinator is cached on disk to fill the entities at startup
+DATA_CACHE_SAVE_DELAY_SECONDS = 60
+# at startup, delay between the background refreshes of the cached coordinators
+DATA_CACHE_REFRESH_STAGGER_SECONDS = 5
+
+# with the batch option of the config entry, all the endpoints of a vehicle are
+# refreshed in one cycle, on a single timer, instead of one timer per endpoint,
+# and its entities are updated together
+# number of endpoints of a vehicle fetched at the same time in a batch cycle
+BATCH_MAX_CONCURRENCY = 3
+
+# a read requested by a service reuses the data of the matching coordinator
+# if it is more recent than this, instead of calling the servers again
+READ_FRESHNESS_SECONDS = 60
+
+# after an action, delays between the refreshes of the affected coordinator
+# until it shows the new state, so the UI does not wait for the next poll
+ACTION_REFRESH_DELAYS_SECONDS = (10, 20, 40, 80)
+
+# the expected result of an action is shown until the servers confirm it,
+# or until this delay elapsed and the data of the servers is shown again
+OPTIMISTIC_STATE_SECONDS = 5 * 60
+
+# Kamereon timestamps parsed recently, kept to skip parsing them again
+TIMESTAMP_CACHE_SIZE = 1024
+
+# endpoints found unsupported or denied are not probed again at startup for
+CAPABILITY_CACHE_TTL = timedelta(days=7)
 
 PLATFORMS = [
     Platform.BINARY_SENSOR,
@@ -1,10 +1,12 @@
 """Proxy to handle account communication with Renault servers."""
 
-import asyncio
-from collections.abc import Awaitable, Callable
-from datetime import timedelta
+from collections.abc import Awaitable, Callable, Mapping
+import dataclasses
+from datetime import datetime, timedelta
+from functools import partial
 import logging
-from typing import TYPE_CHECKING
+from time import monotonic
+from typing import TYPE_CHECKING, Any
 
 from renault_api.kamereon.exceptions import (
     AccessDeniedException,
@@ -14,15 +16,45 @@ from renault_api.kamereon.exceptions import (
 )
 from renault_api.kamereon.models import KamereonVehicleDataAttributes
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .const import OPTIMISTIC_STATE_SECONDS
+
 if TYPE_CHECKING:
     from . import RenaultConfigEntry
+    from .field_index import RenaultFieldIndex
     from .renault_hub import RenaultHub
 
-# We have potentially 7 coordinators per vehicle
-_PARALLEL_SEMAPHORE = asyncio.Semaphore(1)
+
+def _get_changed_fields(
+    previous: KamereonVehicleDataAttributes, data: KamereonVehicleDataAttributes
+) -> set[str]:
+    """Return the names of the model fields that differ."""
+    return {
+        field.name
+        for field in dataclasses.fields(data)
+        if field.name != "raw_data"
+        and getattr(previous, field.name, None) != getattr(data, field.name)
+    }
+
+
+def _get_comparable(value: Any) -> Any:
+    """Return a value without the raw data of its models, to compare it.
+
+    Models built from an action, such as schedules, hold other raw data than
+    the same models loaded from a payload.
+    """
+    if isinstance(value, list):
+        return [_get_comparable(item) for item in value]
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: _get_comparable(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+            if field.name != "raw_data"
+        }
+    return value
 
 
 class RenaultDataUpdateCoordinator[T: KamereonVehicleDataAttributes](
@@ -40,6 +72,9 @@ class RenaultDataUpdateCoordinator[T: KamereonVehicleDataAttributes](
         hub: RenaultHub,
         logger: logging.Logger,
         *,
+        field_index: RenaultFieldIndex,
+        vin: str,
+        key: str,
         name: str,
         update_interval: timedelta,
         update_method: Callable[[], Awaitable[T]],
@@ -53,9 +88,28 @@ class RenaultDataUpdateCoordinator[T: KamereonVehicleDataAttributes](
             update_interval=update_interval,
             update_method=update_method,
         )
+        self.vin = vin
+        self.key = key
+        self._field_index = field_index
         self.access_denied = False
         self.not_supported = False
         self.assumed_state = False
+        # set when the data comes from the disk cache, until the next refresh
+        self.cached_at: datetime | None = None
+        # monotonic time of the last data received from the servers
+        self.fetched_at: float | None = None
+        # fraction of the update interval before the next refresh, once
+        self._phase: float | None = None
+        # refreshed by the batch updater of the vehicle instead of its own timer
+        self.batched = False
+        self._hold_listeners = False
+        self._listeners_pending = False
+        # data, assumed state and success last shown to the listeners
+        self._last_notified: tuple[T | None, bool, bool] | None = None
+        # data as received from the servers, without the optimistic fields
+        self._confirmed_data: T | None = None
+        # expected field values after an action, with their expiry timer
+        self._optimistic: dict[str, tuple[Any, CALLBACK_TYPE]] = {}
 
         self._has_already_worked = False
         self._hub = hub
@@ -73,21 +127,29 @@ class RenaultDataUpdateCoordinator[T: KamereonVehicleDataAttributes](
             self.assumed_state = True
             return self.data
 
+        if self._has_already_worked and self._hub.should_defer_poll():
+            # close to the quota limit, keep the remaining calls for actions
+            self.logger.debug("Renault quota almost used: scan deferred")
+            self.assumed_state = True
+            return self.data
+
         try:
-            async with _PARALLEL_SEMAPHORE:
-                data = await self.update_method()
+            # the update method waits for a slot of the hub scheduler
+            data = await self.update_method()
 
         except AccessDeniedException as err:
             # This can mean both a temporary error or a permanent error. If it has
             # worked before, make it temporary, if not disable the update interval.
-            if not self._has_already_worked:
-                self.update_interval = None
+            # Data restored from the cache does not count: the access may have
+            # been revoked since.
+            if self.fetched_at is None:
                 self.access_denied = True
+                self._async_disable()
             raise UpdateFailed(f"This endpoint is denied: {err}") from err
 
         except QuotaLimitException as err:
-            # The data we got is not bad per see, initiate cooldown for all coordinators
-            self._hub.set_throttled()
+            # The data we got is not bad per see, the hub initiated the cooldown
+            # for all coordinators
             if self._has_already_worked:
                 self.assumed_state = True
                 self.logger.warning("Renault API throttled")
@@ -97,17 +159,230 @@ class RenaultDataUpdateCoordinator[T: KamereonVehicleDataAttributes](
 
         except NotSupportedException as err:
             # Disable because the vehicle does not support this Renault endpoint.
-            self.update_interval = None
             self.not_supported = True
+            self._async_disable()
             raise UpdateFailed(f"This endpoint is not supported: {err}") from err
 
         except KamereonResponseException as err:
             # Other Renault errors.
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+        self._hub.record_update(self, data)
+
         self._has_already_worked = True
         self.assumed_state = False
-        return data
+        self.cached_at = None
+        self.fetched_at = monotonic()
+        self._confirmed_data = data
+        self._reconcile_optimistic(data)
+        if self._optimistic:
+            # the servers may still return the state before the action
+            self.assumed_state = True
+        return self._with_optimistic(data)
+
+    @callback
+    def _async_disable(self) -> None:
+        """Stop polling the endpoint, and give its share of the budget back."""
+        self.update_interval = None
+        self._hub.async_coordinator_disabled(self)
+
+    def get_recent_data(self, max_age_seconds: float) -> T | None:
+        """Return the data if it was received from the servers recently."""
+        if self.fetched_at is None or monotonic() - self.fetched_at > max_age_seconds:
+            return None
+        return self.data
+
+    @callback
+    def async_restore(self, data: T, cached_at: datetime) -> None:
+        """Fill the coordinator with cached data until it is refreshed."""
+        self.data = data
+        self._confirmed_data = data
+        self.cached_at = cached_at
+        self.assumed_state = True
+        # the endpoint worked before the restart
+        self._has_already_worked = True
+
+    @property
+    def has_optimistic_data(self) -> bool:
+        """Return True while the result of an action is not confirmed."""
+        return bool(self._optimistic)
+
+    @callback
+    def async_set_optimistic_data(self, fields: Mapping[str, Any]) -> None:
+        """Show the expected result of an action until the servers confirm it.
+
+        The fields are laid over the data of the servers until a payload holds
+        the same values, or until `OPTIMISTIC_STATE_SECONDS` elapsed.
+        """
+        if self._confirmed_data is None:
+            return
+        for name, value in fields.items():
+            if (previous := self._optimistic.get(name)) is not None:
+                previous[1]()
+            self._optimistic[name] = (
+                value,
+                async_call_later(
+                    self.hass,
+                    OPTIMISTIC_STATE_SECONDS,
+                    partial(self._async_expire_optimistic, name),
+                ),
+            )
+        self.assumed_state = True
+        self.data = self._with_optimistic(self._confirmed_data)
+        self.async_update_listeners()
+
+    @callback
+    def async_drop_optimistic_data(self, fields: Mapping[str, Any]) -> None:
+        """Show the data of the servers again for the fields of a failed action.
+
+        Fields set again by a later action are kept.
+        """
+        dropped = False
+        for name, value in fields.items():
+            if (current := self._optimistic.get(name)) is not None and (
+                current[0] is value
+            ):
+                current[1]()
+                del self._optimistic[name]
+                dropped = True
+        if dropped and self._confirmed_data is not None:
+            self.data = self._with_optimistic(self._confirmed_data)
+            self.async_update_listeners()
+
+    @callback
+    def _async_expire_optimistic(self, name: str, _now: datetime) -> None:
+        """Show the data of the servers again for an unconfirmed field."""
+        self.logger.debug("Optimistic %s of %s not confirmed", name, self.name)
+        del self._optimistic[name]
+        if self._confirmed_data is not None:
+            self.data = self._with_optimistic(self._confirmed_data)
+            self.async_update_listeners()
+
+    def _reconcile_optimistic(self, data: T) -> None:
+        """Drop the optimistic fields confirmed by the servers."""
+        for name, (value, cancel) in list(self._optimistic.items()):
+            if _get_comparable(getattr(data, name)) == _get_comparable(value):
+                cancel()
+                del self._optimistic[name]
+
+    def _with_optimistic(self, data: T) -> T:
+        """Return the data with the optimistic fields laid over it."""
+        if not self._optimistic:
+            return data
+        return dataclasses.replace(
+            data, **{name: value for name, (value, _) in self._optimistic.items()}
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel the optimistic timers and any scheduled call."""
+        for _, cancel in self._optimistic.values():
+            cancel()
+        self._optimistic.clear()
+        await super().async_shutdown()
+
+    @callback
+    def async_set_phase(self, phase: float) -> None:
+        """Set the next refresh at a fraction of the update interval from now.
+
+        Used to spread the refreshes of all coordinators over the interval,
+        instead of firing them all at once after the setup.
+        """
+        self._phase = phase
+        if self._listeners:
+            self._schedule_refresh()
+
+    @property
+    def is_polled(self) -> bool:
+        """Return True if the endpoint is supported and read by an entity."""
+        return self.update_interval is not None and bool(self._listeners)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, and share the budget again on the first one.
+
+        The base coordinator only polls while it has listeners, and entities
+        disabled in the registry are never added, so an endpoint whose
+        entities are all disabled is not polled.
+        """
+        was_polled = self.is_polled
+        remove_listener = super().async_add_listener(update_callback, context)
+        if self.is_polled != was_polled:
+            self._hub.async_schedule_scan_intervals()
+
+        @callback
+        def _remove_listener() -> None:
+            was_polled = self.is_polled
+            remove_listener()
+            if self.is_polled != was_polled:
+                self._hub.async_schedule_scan_intervals()
+
+        return _remove_listener
+
+    @callback
+    def async_hold_listeners(self) -> None:
+        """Delay the notifications of the listeners until released."""
+        self._hold_listeners = True
+
+    @callback
+    def async_release_listeners(self) -> None:
+        """Notify the listeners if an update was held back."""
+        self._hold_listeners = False
+        if self._listeners_pending:
+            self._listeners_pending = False
+            self.async_update_listeners()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners, unless held or nothing changed.
+
+        Polls often return the same payload: the models are compared field by
+        field, raw data included, to spare the entities a no-op state write.
+        When only some fields changed, only the entities reading them are
+        updated, through the field index of the vehicle.
+        """
+        if self._hold_listeners:
+            self._listeners_pending = True
+            return
+        notified = (self.data, self.assumed_state, self.last_update_success)
+        if notified == self._last_notified:
+            self.logger.debug("No change for %s: listeners not updated", self.name)
+            return
+        previous, self._last_notified = self._last_notified, notified
+        if (
+            previous is None
+            or previous[1:] != notified[1:]
+            or previous[0] is None
+            or self.data is None
+        ):
+            super().async_update_listeners()
+            return
+
+        # only the data changed: update the entities reading the changed fields
+        entities = self._field_index.get_entities(
+            self.key, _get_changed_fields(previous[0], self.data)
+        )
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in entities:
+                update_callback()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule a refresh, at the phase of the coordinator if one is set."""
+        if self.batched:
+            # refreshed with the other coordinators of the vehicle
+            return
+        if (phase := self._phase) is None or (
+            update_interval := self.update_interval
+        ) is None:
+            super()._schedule_refresh()
+            return
+
+        self._phase = None
+        self.update_interval = update_interval * phase
+        super()._schedule_refresh()
+        self.update_interval = update_interval
 
     async def async_config_entry_first_refresh(self) -> None:
         """Refresh data for the first time when a config entry is setup.
@@ -8,11 +8,13 @@ from homeassistant.components.device_tracker import (
     TrackerEntity,
     TrackerEntityDescription,
 )
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from . import RenaultConfigEntry
 from .entity import RenaultDataEntity, RenaultDataEntityDescription
+from .entity_plan import has_coordinator
 
 # Coordinator is used to centralize the data updates
 PARALLEL_UPDATES = 0
@@ -34,8 +36,9 @@ async def async_setup_entry(
     entities: list[RenaultDeviceTracker] = [
         RenaultDeviceTracker(vehicle, description)
         for vehicle in config_entry.runtime_data.vehicles.values()
-        for description in DEVICE_TRACKER_TYPES
-        if description.coordinator in vehicle.coordinators
+        for description in vehicle.entity_plan.get_descriptions(
+            vehicle, Platform.DEVICE_TRACKER, DEVICE_TRACKER_TYPES, has_coordinator
+        )
     ]
     async_add_entities(entities)
 
@@ -62,6 +65,8 @@ DEVICE_TRACKER_TYPES: tuple[RenaultTrackerEntityDescription, ...] = (
     RenaultTrackerEntityDescription(
         key="location",
         coordinator="location",
+        source_fields=("gpsLatitude", "gpsLongitude"),
+        redact=True,
         translation_key="location",
     ),
 )
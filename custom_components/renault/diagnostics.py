@@ -9,6 +9,7 @@ from homeassistant.helpers.device_registry import DeviceEntry
 
 from . import RenaultConfigEntry
 from .const import CONF_KAMEREON_ACCOUNT_ID
+from .renault_hub import RenaultHub
 from .renault_vehicle import RenaultVehicleProxy
 
 TO_REDACT = {
@@ -33,9 +34,12 @@ async def async_get_config_entry_diagnostics(
             "data": async_redact_data(entry.data, TO_REDACT),
         },
         "vehicles": [
-            _get_vehicle_diagnostics(vehicle)
+            _get_vehicle_diagnostics(entry.runtime_data, vehicle)
             for vehicle in entry.runtime_data.vehicles.values()
         ],
+        "scheduler": entry.runtime_data.scheduler.metrics,
+        "throttle": entry.runtime_data.throttle_stats,
+        "metrics": entry.runtime_data.metrics.as_dict(),
     }
 
 
@@ -44,18 +48,23 @@ async def async_get_device_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a device."""
     vin = next(iter(device.identifiers))[1]
-    vehicle = entry.runtime_data.vehicles[vin]
+    if (vehicle := entry.runtime_data.vehicles.get(vin)) is None:
+        # the account device, holding the call metrics
+        return await async_get_config_entry_diagnostics(hass, entry)
 
-    return _get_vehicle_diagnostics(vehicle)
+    return _get_vehicle_diagnostics(entry.runtime_data, vehicle)
 
 
-def _get_vehicle_diagnostics(vehicle: RenaultVehicleProxy) -> dict[str, Any]:
+def _get_vehicle_diagnostics(
+    hub: RenaultHub, vehicle: RenaultVehicleProxy
+) -> dict[str, Any]:
     """Return diagnostics for a device."""
+    to_redact_data = TO_REDACT | vehicle.field_index.get_redacted_fields()
     return {
         "details": async_redact_data(vehicle.details.raw_data, TO_REDACT),
         "data": {
             key: (
-                async_redact_data(coordinator.data.raw_data, TO_REDACT)
+                async_redact_data(coordinator.data.raw_data, to_redact_data)
                 # Renault coordinators override async_config_entry_first_refresh
                 # to not raise ConfigEntryNotReady, so coordinator data can be None
                 if coordinator.data
@@ -63,4 +72,37 @@ def _get_vehicle_diagnostics(vehicle: RenaultVehicleProxy) -> dict[str, Any]:
             )
             for key, coordinator in vehicle.coordinators.items()
         },
+        "polling": {
+            key: {
+                "update_interval": (
+                    coordinator.update_interval.total_seconds()
+                    if coordinator.update_interval
+                    else None
+                ),
+                "polled": coordinator.is_polled,
+                **hub.polling.get_stats(coordinator),
+            }
+            for key, coordinator in vehicle.coordinators.items()
+        },
+        "commands": {
+            "queue_depth": vehicle.commands.queue_depth,
+            "collapsed": vehicle.commands.collapsed,
+        },
+        "batch": (
+            {
+                "interval": (
+                    vehicle.batch.interval.total_seconds()
+                    if vehicle.batch.interval
+                    else None
+                ),
+                "last_cycle": vehicle.batch.last_cycle,
+            }
+            if vehicle.batch
+            else None
+        ),
+        "battery_correction": (
+            vehicle.battery_correction.as_dict()
+            if vehicle.battery_correction
+            else None
+        ),
     }
@@ -1,6 +1,8 @@
 """Base classes for Renault entities."""
 
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any, Self
 
 from renault_api.kamereon.models import KamereonVehicleDataAttributes
 
@@ -10,12 +12,19 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .coordinator import RenaultDataUpdateCoordinator
 from .renault_vehicle import RenaultVehicleProxy
 
+# Marks a derived value not computed yet
+_UNSET: Any = object()
+
 
 @dataclass(frozen=True, kw_only=True)
 class RenaultDataEntityDescription(EntityDescription):
     """Class describing Renault data entities."""
 
     coordinator: str
+    # payload fields read by the entity, all of them if empty
+    source_fields: tuple[str, ...] = ()
+    # redact the source fields in the diagnostics
+    redact: bool = False
 
 
 class RenaultEntity(Entity):
@@ -41,14 +50,35 @@ class RenaultDataEntity[T: KamereonVehicleDataAttributes](
 ):
     """Implementation of a Renault entity with a data coordinator."""
 
+    entity_description: RenaultDataEntityDescription
+
     def __init__(
         self,
         vehicle: RenaultVehicleProxy,
         description: RenaultDataEntityDescription,
     ) -> None:
         """Initialise entity."""
-        super().__init__(vehicle.coordinators[description.coordinator])
+        # the entity is the listener context, so the coordinator can only
+        # update the entities reading the fields that changed
+        super().__init__(vehicle.coordinators[description.coordinator], self)
         RenaultEntity.__init__(self, vehicle, description)
+        vehicle.field_index.add(self)
+        # state derived from the coordinator data, and the data it comes from
+        self._derived_data: Any = _UNSET
+        self._derived_value: Any = None
+
+    def _get_derived_value[_V](self, value_fn: Callable[[Self], _V]) -> _V:
+        """Return the state derived from the coordinator data, once per update.
+
+        Home Assistant reads the state property several times per state write.
+        The coordinator replaces its data on each update and never changes it
+        in place, so the value is computed again only when the data object
+        changed.
+        """
+        if (data := self.coordinator.data) is not self._derived_data:
+            self._derived_value = value_fn(self)
+            self._derived_data = data
+        return self._derived_value
 
     @property
     def assumed_state(self) -> bool:
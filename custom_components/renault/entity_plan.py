@@ -0,0 +1,75 @@
+"""Coordinators and entities of the Renault vehicles, compiled once per kind."""
+
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+from renault_api.kamereon.models import KamereonVehicleDetails
+
+from homeassistant.const import Platform
+
+if TYPE_CHECKING:
+    from .entity import RenaultDataEntityDescription
+    from .renault_vehicle import RenaultCoordinatorDescription, RenaultVehicleProxy
+
+type RenaultVehicleKind = tuple[str | None, str | None, str | None]
+
+
+def get_vehicle_kind(details: KamereonVehicleDetails) -> RenaultVehicleKind:
+    """Return what the coordinators and entities of a vehicle depend on.
+
+    The endpoints and specifications of a vehicle come from its model code,
+    and the fuel and electricity checks from its energy.
+    """
+    return (
+        details.get_model_code(),
+        details.engineEnergyType,
+        details.get_energy_code(),
+    )
+
+
+def has_coordinator(
+    vehicle: RenaultVehicleProxy, description: RenaultDataEntityDescription
+) -> bool:
+    """Check if the coordinator of a data entity is available for the vehicle."""
+    return description.coordinator in vehicle.coordinators
+
+
+class RenaultEntityPlan:
+    """Coordinators and entity descriptions of the vehicles of a kind.
+
+    The checks of the descriptions against the vehicle are run for the first
+    vehicle of each kind, and the result is reused for the others. As some
+    endpoints are only found unavailable once probed, the descriptions are
+    compiled for each set of available coordinators.
+    """
+
+    def __init__(
+        self,
+        details: KamereonVehicleDetails,
+        coordinators: Iterable[RenaultCoordinatorDescription],
+    ) -> None:
+        """Initialise plan."""
+        self.coordinators = tuple(
+            coord
+            for coord in coordinators
+            if details.supports_endpoint(coord.endpoint)
+            and (not coord.requires_electricity or details.uses_electricity())
+        )
+        self._descriptions: dict[tuple[Platform, frozenset[str]], tuple] = {}
+
+    def get_descriptions[_D](
+        self,
+        vehicle: RenaultVehicleProxy,
+        platform: Platform,
+        descriptions: Iterable[_D],
+        is_supported: Callable[[RenaultVehicleProxy, _D], bool],
+    ) -> tuple[_D, ...]:
+        """Return the descriptions of a platform supported by the vehicle."""
+        key = (platform, frozenset(vehicle.coordinators))
+        if (supported := self._descriptions.get(key)) is None:
+            supported = self._descriptions[key] = tuple(
+                description
+                for description in descriptions
+                if is_supported(vehicle, description)
+            )
+        return supported
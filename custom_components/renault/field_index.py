@@ -0,0 +1,52 @@
+"""Index of the Renault entities by the payload fields they read."""
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .entity import RenaultDataEntity
+
+
+class RenaultFieldIndex:
+    """Entities of a vehicle, by coordinator and source field.
+
+    Entities whose description has no source fields are assumed to read the
+    whole payload.
+    """
+
+    def __init__(self) -> None:
+        """Initialise index."""
+        self._entities: dict[str, list[RenaultDataEntity]] = {}
+        self._fields: dict[tuple[str, str], list[RenaultDataEntity]] = {}
+
+    def add(self, entity: RenaultDataEntity) -> None:
+        """Index an entity by the source fields of its description."""
+        description = entity.entity_description
+        self._entities.setdefault(description.coordinator, []).append(entity)
+        for field in description.source_fields:
+            self._fields.setdefault((description.coordinator, field), []).append(
+                entity
+            )
+
+    def get_entities(
+        self, coordinator: str, fields: Iterable[str]
+    ) -> set[RenaultDataEntity]:
+        """Return the entities reading any of the fields of a coordinator."""
+        result = {
+            entity
+            for entity in self._entities.get(coordinator, ())
+            if not entity.entity_description.source_fields
+        }
+        for field in fields:
+            result.update(self._fields.get((coordinator, field), ()))
+        return result
+
+    def get_redacted_fields(self) -> set[str]:
+        """Return the fields read by entities whose data must be redacted."""
+        return {
+            field
+            for entities in self._entities.values()
+            for entity in entities
+            if entity.entity_description.redact
+            for field in entity.entity_description.source_fields
+        }
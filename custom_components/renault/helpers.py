@@ -0,0 +1,27 @@
+"""Helpers shared by the Renault platforms."""
+
+from datetime import datetime
+from functools import lru_cache
+
+from homeassistant.util.dt import as_utc, parse_datetime
+
+from .const import TIMESTAMP_CACHE_SIZE
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _parse_utc(value: str) -> datetime | None:
+    """Parse a Kamereon timestamp to UTC."""
+    if (original_dt := parse_datetime(value)) is None:
+        return None
+    return as_utc(original_dt)
+
+
+def get_utc_value(value: str | None) -> datetime | None:
+    """Return the UTC value of a Kamereon timestamp.
+
+    Timestamps rarely change between polls, so the parsed values are kept in
+    a bounded cache. The datetimes are immutable and safe to share.
+    """
+    if value is None:
+        return None
+    return _parse_utc(value)
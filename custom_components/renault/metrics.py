@@ -0,0 +1,110 @@
+"""Latency and error metrics of the calls to the Renault servers."""
+
+from bisect import bisect_left
+from collections import Counter
+from typing import Any
+
+# Upper bounds of the latency buckets, in seconds
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class LatencyHistogram:
+    """Durations counted in fixed buckets.
+
+    Percentiles are estimated as the upper bound of the bucket holding them,
+    or the maximum for the last bucket, so memory does not grow with calls.
+    """
+
+    __slots__ = ("count", "counts", "max", "total")
+
+    def __init__(self) -> None:
+        """Initialise histogram."""
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Count a duration."""
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, ratio: float) -> float | None:
+        """Return the estimated duration below which the ratio of calls fall."""
+        if not self.count:
+            return None
+        rank = ratio * self.count
+        cumulated = 0
+        for index, count in enumerate(self.counts):
+            cumulated += count
+            if cumulated >= rank:
+                if index < len(LATENCY_BUCKETS):
+                    return min(LATENCY_BUCKETS[index], self.max)
+                break
+        return self.max
+
+    @property
+    def average(self) -> float | None:
+        """Return the average duration."""
+        return self.total / self.count if self.count else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary of the histogram."""
+        return {
+            "count": self.count,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": round(self.max, 3),
+        }
+
+
+class RenaultMetrics:
+    """Metrics of the calls of an account, by endpoint.
+
+    Endpoints are named by coordinator key or action kind, and are shared by
+    all the vehicles of the account, so that no VIN leaks in the metrics.
+    """
+
+    def __init__(self) -> None:
+        """Initialise metrics."""
+        self.latency: dict[str, LatencyHistogram] = {}
+        self.slot_wait = LatencyHistogram()
+        self.errors: Counter[str] = Counter()
+
+    def record_call(self, endpoint: str, seconds: float) -> None:
+        """Record the duration of a call, successful or not."""
+        if (histogram := self.latency.get(endpoint)) is None:
+            histogram = self.latency[endpoint] = LatencyHistogram()
+        histogram.record(seconds)
+
+    def record_error(self, err: BaseException) -> None:
+        """Count a failed call by exception type."""
+        self.errors[type(err).__name__] += 1
+
+    def percentile(self, ratio: float) -> float | None:
+        """Return the latency percentile of the slowest endpoint."""
+        values = [
+            value
+            for histogram in self.latency.values()
+            if (value := histogram.percentile(ratio)) is not None
+        ]
+        return max(values, default=None)
+
+    @property
+    def error_count(self) -> int:
+        """Return the number of failed calls."""
+        return sum(self.errors.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics."""
+        return {
+            "latency": {
+                endpoint: histogram.as_dict()
+                for endpoint, histogram in sorted(self.latency.items())
+            },
+            "slot_wait": self.slot_wait.as_dict(),
+            "errors": dict(self.errors),
+        }
@@ -15,7 +15,7 @@ from homeassistant.components.number import (
     NumberEntityDescription,
     NumberMode,
 )
-from homeassistant.const import PERCENTAGE
+from homeassistant.const import PERCENTAGE, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
@@ -23,10 +23,11 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from . import RenaultConfigEntry
 from .const import DOMAIN
 from .entity import RenaultDataEntity, RenaultDataEntityDescription
+from .entity_plan import has_coordinator
 
 # Coordinator is used to centralize the data updates
-# but renault servers are unreliable and it's safer to queue action calls
-PARALLEL_UPDATES = 1
+# and action calls are queued, and collapsed, by the vehicle command queue
+PARALLEL_UPDATES = 0
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -44,7 +45,8 @@ async def _set_charge_limit_min(
 ) -> None:
     """Set the minimum SOC.
 
-    The target SOC is required to set the minimum SOC, so we need to fetch it first.
+    The target SOC is required to set the minimum SOC: the one shown is used, as
+    it includes a target change still waiting in the command queue.
     """
     if (target_soc := entity.coordinator.data.socTarget) is None:
         raise ServiceValidationError(
@@ -59,7 +61,8 @@ async def _set_charge_limit_target(
 ) -> None:
     """Set the target SOC.
 
-    The minimum SOC is required to set the target SOC, so we need to fetch it first.
+    The minimum SOC is required to set the target SOC: the one shown is used, as
+    it includes a minimum change still waiting in the command queue.
     """
     if (min_soc := entity.coordinator.data.socMin) is None:
         raise ServiceValidationError(
@@ -76,17 +79,12 @@ async def _set_charge_limits(
 ) -> None:
     """Set the minimum and target SOC.
 
-    Optimistically update local coordinator data so the new
-    limits are reflected immediately without a remote refresh,
-    as Renault servers may still cache old values.
+    The vehicle proxy shows the new limits as soon as they are queued, so that
+    a quick change of the other limit is sent with them, and as Renault
+    servers may still cache old values.
     """
     await entity.vehicle.set_battery_soc(min_soc=min_soc, target_soc=target_soc)
 
-    entity.coordinator.data.socMin = min_soc
-    entity.coordinator.data.socTarget = target_soc
-    entity.coordinator.assumed_state = True
-    entity.coordinator.async_set_updated_data(entity.coordinator.data)
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -97,8 +95,9 @@ async def async_setup_entry(
     entities: list[RenaultNumberEntity] = [
         RenaultNumberEntity(vehicle, description)
         for vehicle in config_entry.runtime_data.vehicles.values()
-        for description in NUMBER_TYPES
-        if description.coordinator in vehicle.coordinators
+        for description in vehicle.entity_plan.get_descriptions(
+            vehicle, Platform.NUMBER, NUMBER_TYPES, has_coordinator
+        )
     ]
     async_add_entities(entities)
 
@@ -113,7 +112,7 @@ class RenaultNumberEntity[T: KamereonVehicleDataAttributes](
     @property
     def native_value(self) -> float | None:
         """Return the entity value to represent the entity state."""
-        return self.entity_description.value_fn(self)
+        return self._get_derived_value(self.entity_description.value_fn)
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
@@ -124,6 +123,7 @@ NUMBER_TYPES: tuple[RenaultNumberEntityDescription, ...] = (
     RenaultNumberEntityDescription[KamereonVehicleBatterySocData](
         key="charge_limit_min",
         coordinator="battery_soc",
+        source_fields=("socMin",),
         update_fn=_set_charge_limit_min,
         device_class=NumberDeviceClass.BATTERY,
         native_min_value=15,
@@ -137,6 +137,7 @@ NUMBER_TYPES: tuple[RenaultNumberEntityDescription, ...] = (
     RenaultNumberEntityDescription[KamereonVehicleBatterySocData](
         key="charge_limit_target",
         coordinator="battery_soc",
+        source_fields=("socTarget",),
         update_fn=_set_charge_limit_target,
         device_class=NumberDeviceClass.BATTERY,
         native_min_value=55,
@@ -0,0 +1,151 @@
+"""Allocation of the hourly call budget across Renault coordinators."""
+
+from collections.abc import Iterable
+from datetime import timedelta
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from renault_api.kamereon.enums import ChargeState
+from renault_api.kamereon.models import (
+    KamereonVehicleBatteryStatusData,
+    KamereonVehicleDataAttributes,
+    KamereonVehicleHvacStatusData,
+)
+
+from .const import (
+    POLLING_BOOST_DURATION_SECONDS,
+    POLLING_BOOST_FACTOR,
+    POLLING_IDLE_FACTOR,
+    POLLING_INITIAL_CHANGE_RATE,
+    POLLING_MIN_SCAN_INTERVAL_SECONDS,
+    POLLING_MIN_WEIGHT,
+    POLLING_SMOOTHING,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import RenaultDataUpdateCoordinator
+
+# Coordinators polled faster while the vehicle is charging or conditioning
+BOOSTED_COORDINATORS = {"battery", "hvac_status"}
+# Coordinators polled slower to pay for it
+IDLE_COORDINATORS = {"cockpit", "lock_status", "pressure", "res_state"}
+
+
+def _is_active(key: str, data: KamereonVehicleDataAttributes) -> bool | None:
+    """Return True if the data shows a charge or the HVAC in progress."""
+    if key == "battery" and isinstance(data, KamereonVehicleBatteryStatusData):
+        return data.get_charging_status() == ChargeState.CHARGE_IN_PROGRESS
+    if key == "hvac_status" and isinstance(data, KamereonVehicleHvacStatusData):
+        return data.hvacStatus == "on"
+    return None
+
+
+class _EndpointStats:
+    """Observed change rate of a coordinator."""
+
+    __slots__ = ("change_rate", "changes", "polls")
+
+    def __init__(self) -> None:
+        """Initialise stats."""
+        self.change_rate = POLLING_INITIAL_CHANGE_RATE
+        self.changes = 0
+        self.polls = 0
+
+
+class RenaultPollingAllocator:
+    """Share the hourly call budget based on how often each endpoint changes.
+
+    The change rate is the smoothed probability that a poll returns a payload
+    different from the previous one. Each coordinator is weighted by its change
+    rate, plus a floor so that static endpoints are still polled, and receives
+    the matching share of the budget.
+
+    While a vehicle is charging or conditioning, and for a while after, its
+    battery and hvac coordinators get a bigger share and its idle coordinators
+    a smaller one. The budget itself never changes.
+    """
+
+    def __init__(self, max_calls_per_hour: float) -> None:
+        """Initialise allocator."""
+        self._budget = max_calls_per_hour
+        self._stats: dict[str, _EndpointStats] = {}
+        self._active: dict[str, set[str]] = {}
+        self._boost_until: dict[str, float] = {}
+
+    def record_update(
+        self,
+        coordinator: RenaultDataUpdateCoordinator,
+        data: KamereonVehicleDataAttributes,
+    ) -> None:
+        """Record the outcome of a successful poll of a coordinator."""
+        if (active := _is_active(coordinator.key, data)) is not None:
+            active_keys = self._active.setdefault(coordinator.vin, set())
+            if active:
+                active_keys.add(coordinator.key)
+            else:
+                active_keys.discard(coordinator.key)
+            if active_keys:
+                self._boost_until[coordinator.vin] = (
+                    monotonic() + POLLING_BOOST_DURATION_SECONDS
+                )
+
+        if coordinator.data is None:
+            # nothing to compare with
+            return
+        changed = data.raw_data != coordinator.data.raw_data
+        stats = self._stats.setdefault(coordinator.name, _EndpointStats())
+        stats.polls += 1
+        if changed:
+            stats.changes += 1
+        stats.change_rate += POLLING_SMOOTHING * (
+            float(changed) - stats.change_rate
+        )
+
+    def is_boosted(self, vin: str) -> bool:
+        """Return True if the vehicle is charging or conditioning."""
+        return self._boost_until.get(vin, 0) > monotonic()
+
+    def weight(self, coordinator: RenaultDataUpdateCoordinator) -> float:
+        """Return the share weight of a coordinator."""
+        if (stats := self._stats.get(coordinator.name)) is None:
+            weight = POLLING_MIN_WEIGHT + POLLING_INITIAL_CHANGE_RATE
+        else:
+            weight = POLLING_MIN_WEIGHT + stats.change_rate
+        if self.is_boosted(coordinator.vin):
+            if coordinator.key in BOOSTED_COORDINATORS:
+                weight *= POLLING_BOOST_FACTOR
+            elif coordinator.key in IDLE_COORDINATORS:
+                weight *= POLLING_IDLE_FACTOR
+        return weight
+
+    def allocate(
+        self, coordinators: Iterable[RenaultDataUpdateCoordinator]
+    ) -> dict[str, timedelta]:
+        """Return the scan interval of each coordinator, by name.
+
+        The sum of the calls per hour of all coordinators equals the budget,
+        except when an interval is raised to the minimum scan interval.
+        """
+        weights = {
+            coordinator.name: self.weight(coordinator) for coordinator in coordinators
+        }
+        total_weight = sum(weights.values())
+        return {
+            name: timedelta(
+                seconds=max(
+                    POLLING_MIN_SCAN_INTERVAL_SECONDS,
+                    round(3600 * total_weight / (self._budget * weight)),
+                )
+            )
+            for name, weight in weights.items()
+        }
+
+    def get_stats(self, coordinator: RenaultDataUpdateCoordinator) -> dict[str, Any]:
+        """Return the observed change rate of a coordinator."""
+        stats = self._stats.get(coordinator.name) or _EndpointStats()
+        return {
+            "polls": stats.polls,
+            "changes": stats.changes,
+            "change_rate": round(stats.change_rate, 3),
+            "boosted": self.is_boosted(coordinator.vin),
+        }
@@ -0,0 +1,72 @@
+"""Book-keeping of the calls made to the Renault servers."""
+
+from collections import deque
+from time import monotonic
+
+
+class CallLedger:
+    """Rolling window of the calls made by an account."""
+
+    def __init__(self, window_seconds: float = 3600) -> None:
+        """Initialise ledger."""
+        self._window = window_seconds
+        self._calls: deque[float] = deque()
+
+    def _prune(self, now: float) -> None:
+        """Forget the calls that left the window."""
+        while self._calls and self._calls[0] <= now - self._window:
+            self._calls.popleft()
+
+    def record(self) -> None:
+        """Record a call made now."""
+        now = monotonic()
+        self._prune(now)
+        self._calls.append(now)
+
+    def count(self) -> int:
+        """Return the number of calls made in the window."""
+        self._prune(monotonic())
+        return len(self._calls)
+
+
+class ThrottleBackoff:
+    """Cooldown after the Renault servers refused calls for quota reasons.
+
+    The cooldown is doubled when the servers still refuse calls right after a
+    cooldown, and halved when a cooldown was followed by a successful call, so
+    it converges to the shortest pause that the servers accept.
+    """
+
+    def __init__(self, min_seconds: float, max_seconds: float) -> None:
+        """Initialise backoff."""
+        self._min = min_seconds
+        self._max = max_seconds
+        self._cooldown = min_seconds
+        self._until: float | None = None
+        self.events = 0
+
+    def record_throttle(self) -> None:
+        """Start a cooldown, unless one is already running."""
+        now = monotonic()
+        if self._until is not None:
+            if now < self._until:
+                return
+            # still refused right after the previous cooldown
+            self._cooldown = min(self._cooldown * 2, self._max)
+        self._until = now + self._cooldown
+        self.events += 1
+
+    def record_success(self) -> None:
+        """Learn that the servers accept calls again."""
+        if self._until is not None and monotonic() >= self._until:
+            self._cooldown = max(self._cooldown / 2, self._min)
+            self._until = None
+
+    def is_active(self) -> bool:
+        """Return True during a cooldown."""
+        return self._until is not None and monotonic() < self._until
+
+    @property
+    def cooldown_seconds(self) -> float:
+        """Return the duration of the current or next cooldown."""
+        return self._cooldown
@@ -1,13 +1,25 @@
 """Proxy to handle account communication with Renault servers."""
 
 import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import timedelta
 import logging
-from typing import TYPE_CHECKING
+from time import monotonic
+from typing import TYPE_CHECKING, Any
 
-from renault_api.gigya.exceptions import InvalidCredentialsException
-from renault_api.kamereon.models import KamereonVehiclesLink
+import aiohttp
+from renault_api.exceptions import RenaultException
+from renault_api.gigya.exceptions import GigyaException, InvalidCredentialsException
+from renault_api.kamereon.exceptions import QuotaLimitException
+from renault_api.kamereon.models import (
+    KamereonVehicleDataAttributes,
+    KamereonVehicleDetails,
+    KamereonVehiclesLink,
+    KamereonVehiclesResponse,
+)
 from renault_api.renault_account import RenaultAccount
+from renault_api.renault_vehicle import RenaultVehicle
 from renault_api.renault_client import RenaultClient
 
 from homeassistant.const import (
@@ -16,23 +28,44 @@ from homeassistant.const import (
     ATTR_MODEL,
     ATTR_MODEL_ID,
     ATTR_NAME,
+    CONF_PASSWORD,
+    CONF_USERNAME,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import dt as dt_util
 
 if TYPE_CHECKING:
     from . import RenaultConfigEntry
-
-from time import time
+    from .coordinator import RenaultDataUpdateCoordinator
 
 from .const import (
     CONF_KAMEREON_ACCOUNT_ID,
-    COOLING_UPDATES_SECONDS,
+    COOLING_UPDATES_MAX_SECONDS,
+    COOLING_UPDATES_MIN_SECONDS,
+    DATA_CACHE_REFRESH_STAGGER_SECONDS,
+    LOGIN_RETRY_DELAYS_SECONDS,
     MAX_CALLS_PER_HOURS,
+    MAX_PARALLEL_REQUESTS,
+    QUOTA_ACTION_RESERVE_CALLS,
+    QUOTA_SOFT_LIMIT_RATIO,
 )
+from .entity_plan import RenaultEntityPlan, RenaultVehicleKind, get_vehicle_kind
+from .metrics import RenaultMetrics
+from .polling import RenaultPollingAllocator
+from .quota import CallLedger, ThrottleBackoff
 from .renault_vehicle import COORDINATORS, RenaultVehicleProxy
+from .scheduler import PRIORITY_POLL, PRIORITY_REFRESH, RenaultRequestScheduler
+from .storage import (
+    RenaultAccountCache,
+    RenaultBatteryCorrectionCache,
+    RenaultCaches,
+    RenaultCapabilityCache,
+    RenaultDataCache,
+    async_get_caches,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -42,7 +75,11 @@ async def _get_filtered_vehicles(account: RenaultAccount) -> list[KamereonVehicl
 
     May be due to new purchases, or issue with the Renault servers.
     """
-    vehicles = await account.get_vehicles()
+    return _filter_vehicles(await account.get_vehicles())
+
+
+def _filter_vehicles(vehicles: KamereonVehiclesResponse) -> list[KamereonVehiclesLink]:
+    """Filter out vehicles with missing details."""
     if not vehicles.vehicleLinks:
         return []
     result: list[KamereonVehiclesLink] = []
@@ -65,24 +102,171 @@ class RenaultHub:
         )
         self._account: RenaultAccount | None = None
         self._vehicles: dict[str, RenaultVehicleProxy] = {}
+        self._entity_plans: dict[RenaultVehicleKind, RenaultEntityPlan] = {}
+        self._ledger = CallLedger()
+        self._metrics = RenaultMetrics()
+        self._scheduler = RenaultRequestScheduler(
+            hass,
+            self._ledger,
+            self._metrics.slot_wait,
+            MAX_CALLS_PER_HOURS,
+            MAX_PARALLEL_REQUESTS,
+        )
+        # polls are deferred at the soft limit: the polling budget stays below
+        # it, with a reserve for the actions and their refreshes
+        self._soft_limit = MAX_CALLS_PER_HOURS * QUOTA_SOFT_LIMIT_RATIO
+        self._polling_budget = max(self._soft_limit - QUOTA_ACTION_RESERVE_CALLS, 1)
+        self._polling = RenaultPollingAllocator(self._polling_budget)
 
-        self._got_throttled_at_time: float | None = None
+        self._backoff = ThrottleBackoff(
+            COOLING_UPDATES_MIN_SECONDS, COOLING_UPDATES_MAX_SECONDS
+        )
+        self._caches: RenaultCaches | None = None
+        self._login_task: asyncio.Task[bool] | None = None
+        self._login_entry: RenaultConfigEntry | None = None
+        # the budget is shared once all the vehicles are set up, then at most
+        # once per event loop iteration
+        self._initialised = False
+        self._share_budget_handle: asyncio.Handle | None = None
+        # names of the coordinators polled when the phases were last spread
+        self._phased: set[str] = set()
 
     def set_throttled(self) -> None:
         """We got throttled, we need to adjust the rate limit."""
-        if self._got_throttled_at_time is None:
-            self._got_throttled_at_time = time()
+        self._backoff.record_throttle()
 
     def is_throttled(self) -> bool:
         """Check if we are throttled."""
-        if self._got_throttled_at_time is None:
-            return False
+        return self._backoff.is_active()
 
-        if time() - self._got_throttled_at_time > COOLING_UPDATES_SECONDS:
-            self._got_throttled_at_time = None
-            return False
+    def should_defer_poll(self) -> bool:
+        """Check if polls should wait to keep away from the quota limit."""
+        return self._ledger.count() >= self._soft_limit
 
-        return True
+    @asynccontextmanager
+    async def async_call(
+        self, endpoint: str, priority: int = PRIORITY_POLL
+    ) -> AsyncIterator[None]:
+        """Schedule, account and measure a call to the Renault servers."""
+        if self._login_task is not None and not await self._async_wait_login():
+            raise ConfigEntryAuthFailed("Login to Renault failed")
+        async with self._scheduler.async_slot(priority):
+            start = monotonic()
+            try:
+                yield
+            except Exception as err:
+                self._metrics.record_error(err)
+                if isinstance(err, QuotaLimitException):
+                    self.set_throttled()
+                raise
+            finally:
+                self._metrics.record_call(endpoint, monotonic() - start)
+            self._backoff.record_success()
+
+    def record_update(
+        self,
+        coordinator: RenaultDataUpdateCoordinator,
+        data: KamereonVehicleDataAttributes,
+    ) -> None:
+        """Learn from a successful poll and share the budget again."""
+        self._polling.record_update(coordinator, data)
+        self.async_schedule_scan_intervals()
+        self.data_cache.async_set(coordinator.vin, coordinator.key, data.raw_data)
+
+    def update_scan_intervals(self) -> None:
+        """Share the hourly call budget between the polled coordinators.
+
+        Coordinators without listeners, because all their entities are
+        disabled, are not polled and leave their share to the others.
+        """
+        intervals = self._polling.allocate(
+            coordinator
+            for vehicle in self._vehicles.values()
+            for coordinator in vehicle.coordinators.values()
+            if coordinator.is_polled
+        )
+        for vehicle in self._vehicles.values():
+            vehicle.update_scan_interval(
+                {
+                    key: intervals[coordinator.name]
+                    for key, coordinator in vehicle.coordinators.items()
+                    if coordinator.name in intervals
+                }
+            )
+
+    @callback
+    def async_schedule_scan_intervals(self) -> None:
+        """Share the budget again at the next event loop iteration.
+
+        Polls and listeners ask for it in bursts, and each sharing goes over
+        all the coordinators of the account: a burst is served once, and the
+        requests made during the setup are served at its end.
+        """
+        if self._initialised and self._share_budget_handle is None:
+            self._share_budget_handle = self._hass.loop.call_soon(
+                self._async_share_budget
+            )
+
+    @callback
+    def _async_share_budget(self) -> None:
+        """Share the budget requested during the last iteration.
+
+        When endpoints started or stopped being polled, the phases are spread
+        again over the new set of coordinators.
+        """
+        self._share_budget_handle = None
+        self.update_scan_intervals()
+        if self._get_polled_names() != self._phased:
+            self.update_phases()
+
+    def _get_polled_names(self) -> set[str]:
+        """Return the names of the polled coordinators."""
+        return {
+            coordinator.name
+            for vehicle in self._vehicles.values()
+            for coordinator in vehicle.coordinators.values()
+            if coordinator.is_polled
+        }
+
+    @callback
+    def async_coordinator_disabled(
+        self, coordinator: RenaultDataUpdateCoordinator
+    ) -> None:
+        """Share the budget again once a coordinator is no longer polled.
+
+        During the setup, the vehicle removes the coordinator itself. Later,
+        the coordinator keeps its entities, but the endpoint is recorded so
+        that it is not probed again at the next startup.
+        """
+        if (vehicle := self._vehicles.get(coordinator.vin)) is not None:
+            LOGGER.warning(
+                "Ignoring endpoint %s as it is %s",
+                coordinator.name,
+                "not supported" if coordinator.not_supported else "denied",
+            )
+            vehicle.async_record_unavailable(coordinator)
+        self.async_schedule_scan_intervals()
+
+    def update_phases(self) -> None:
+        """Spread the next refresh of the active coordinators over their interval."""
+        self._phased = self._get_polled_names()
+        # vehicles refreshed in batches are started as a whole
+        batches = [
+            vehicle.batch
+            for vehicle in self._vehicles.values()
+            if vehicle.batch is not None
+        ]
+        for index, batch in enumerate(batches):
+            batch.async_start((index + 1) / len(batches))
+        coordinators = [
+            coordinator
+            for vehicle in self._vehicles.values()
+            if vehicle.batch is None
+            for coordinator in vehicle.coordinators.values()
+            if coordinator.is_polled
+        ]
+        for index, coordinator in enumerate(coordinators):
+            coordinator.async_set_phase((index + 1) / len(coordinators))
 
     async def attempt_login(self, username: str, password: str) -> bool:
         """Attempt login to Renault servers."""
@@ -94,12 +278,102 @@ class RenaultHub:
             return True
         return False
 
+    async def async_load_caches(self, config_entry: RenaultConfigEntry) -> None:
+        """Load the caches of the config entry, and save them on unload."""
+        self._caches = async_get_caches(self._hass, config_entry.entry_id)
+        await self._caches.async_load()
+        config_entry.async_on_unload(self._caches.async_flush)
+
+    def has_cached_vehicles(self, config_entry: RenaultConfigEntry) -> bool:
+        """Check if the vehicles of the account are known from the cache."""
+        return (
+            self.account_cache.get_vehicles(config_entry.data[CONF_KAMEREON_ACCOUNT_ID])
+            is not None
+        )
+
+    def async_start_login(self, config_entry: RenaultConfigEntry) -> None:
+        """Login in the background, calls to the servers wait for it."""
+        self._login_entry = config_entry
+        self._login_task = config_entry.async_create_background_task(
+            self._hass, self._async_login(config_entry), "renault login"
+        )
+
+    async def _async_wait_login(self) -> bool:
+        """Wait for the background login, starting it again if it failed to connect.
+
+        Connection errors of the login are raised to the waiting calls. Bad
+        credentials are reported by the caller, so that the reauthentication
+        is started by the coordinators or the setup only.
+        """
+        assert self._login_task is not None and self._login_entry is not None
+        task = self._login_task
+        if task.done() and not task.cancelled() and task.exception() is not None:
+            # the last login could not reach the servers
+            self.async_start_login(self._login_entry)
+            task = self._login_task
+        # a cancelled caller must not cancel the login of the other callers
+        return await asyncio.shield(task)
+
+    def raise_on_login_failure(self) -> None:
+        """Raise if the background login is over and failed."""
+        if (task := self._login_task) is None or not task.done() or task.cancelled():
+            return
+        if (err := task.exception()) is not None:
+            raise ConfigEntryNotReady(f"Login to Renault failed: {err}") from err
+        if not task.result():
+            raise ConfigEntryAuthFailed("Login to Renault failed")
+
+    async def _async_login(self, config_entry: RenaultConfigEntry) -> bool:
+        """Login, retrying a few times on connection errors, then check vehicles."""
+        for delay in (*LOGIN_RETRY_DELAYS_SECONDS, None):
+            try:
+                login_success = await self.attempt_login(
+                    config_entry.data[CONF_USERNAME], config_entry.data[CONF_PASSWORD]
+                )
+            except (aiohttp.ClientConnectionError, GigyaException) as exc:
+                if delay is None:
+                    LOGGER.warning("Login to Renault failed: %s", exc)
+                    raise
+                LOGGER.warning(
+                    "Login to Renault failed, retrying in %s seconds: %s", delay, exc
+                )
+                await asyncio.sleep(delay)
+            else:
+                break
+
+        if not login_success:
+            return False
+
+        config_entry.async_create_background_task(
+            self._hass,
+            self._async_revalidate_vehicles(config_entry),
+            "renault vehicles revalidation",
+        )
+        return True
+
+    async def _async_revalidate_vehicles(self, config_entry: RenaultConfigEntry) -> None:
+        """Check the cached vehicles against the servers, reload if they changed."""
+        assert self._account is not None
+        try:
+            async with self.async_call("vehicles", PRIORITY_REFRESH):
+                vehicles = await self._account.get_vehicles()
+        except (aiohttp.ClientError, RenaultException) as err:
+            LOGGER.debug("Unable to check the vehicles of the account: %s", err)
+            return
+        if self.account_cache.async_set_vehicles(self._account.account_id, vehicles):
+            LOGGER.info("Vehicles of the Renault account changed, reloading")
+            self._hass.config_entries.async_schedule_reload(config_entry.entry_id)
+
     async def async_initialise(self, config_entry: RenaultConfigEntry) -> None:
         """Set up proxy."""
         account_id: str = config_entry.data[CONF_KAMEREON_ACCOUNT_ID]
 
         self._account = await self._client.get_api_account(account_id)
-        vehicle_links = await _get_filtered_vehicles(self._account)
+        if (vehicles := self.account_cache.get_vehicles(account_id)) is None:
+            async with self.async_call("vehicles", PRIORITY_REFRESH):
+                vehicles = await self._account.get_vehicles()
+            self.account_cache.async_set_vehicles(account_id, vehicles)
+        vehicle_links = _filter_vehicles(vehicles)
         if not vehicle_links:
             LOGGER.debug(
                 "No valid vehicle details found for account_id: %s", account_id
@@ -108,12 +382,18 @@ class RenaultHub:
                 "Failed to retrieve vehicle details from Renault servers"
             )
 
-        num_call_per_scan = len(COORDINATORS) * len(vehicle_links)
+        # use the number of active coordinators found at the last startup, if known
+        num_call_per_scan = 0
+        for vehicle_link in vehicle_links:
+            assert vehicle_link.vehicleDetails is not None
+            count = self.capability_cache.get_coordinator_count(
+                str(vehicle_link.vin), vehicle_link.vehicleDetails.get_model_code()
+            )
+            num_call_per_scan += len(COORDINATORS) if count is None else count
         scan_interval = timedelta(
-            seconds=(3600 * num_call_per_scan) / MAX_CALLS_PER_HOURS
+            seconds=(3600 * max(num_call_per_scan, 1)) / self._polling_budget
         )
 
-        device_registry = dr.async_get(self._hass)
         await asyncio.gather(
             *(
                 self.async_initialise_vehicle(
@@ -121,26 +401,59 @@ class RenaultHub:
                     self._account,
                     scan_interval,
                     config_entry,
-                    device_registry,
                 )
                 for vehicle_link in vehicle_links
             )
         )
+        self._async_update_devices(config_entry)
 
         # all vehicles have been initiated with the right number of active coordinators
-        num_call_per_scan = 0
-        for vehicle_link in vehicle_links:
-            vehicle = self._vehicles[str(vehicle_link.vin)]
-            num_call_per_scan += len(vehicle.coordinators)
+        self._initialised = True
+        self.update_scan_intervals()
+        self.update_phases()
+
+    @callback
+    def async_start_cached_refresh(self, config_entry: RenaultConfigEntry) -> None:
+        """Refresh the stale coordinators filled from the cache, in the background.
 
-        new_scan_interval = timedelta(
-            seconds=(3600 * num_call_per_scan) / MAX_CALLS_PER_HOURS
+        Called once the platforms are set up: only the coordinators with
+        subscribed entities are refreshed.
+        """
+        cached_coordinators = sorted(
+            (
+                coordinator
+                for vehicle in self._vehicles.values()
+                for coordinator in vehicle.coordinators.values()
+                if coordinator.cached_at is not None
+            ),
+            key=lambda coordinator: coordinator.cached_at or dt_util.utcnow(),
         )
-        if new_scan_interval != scan_interval:
-            # we need to change the vehicles with the right scan interval
-            for vehicle_link in vehicle_links:
-                vehicle = self._vehicles[str(vehicle_link.vin)]
-                vehicle.update_scan_interval(new_scan_interval)
+        if cached_coordinators:
+            config_entry.async_create_background_task(
+                self._hass,
+                self._async_refresh_cached(cached_coordinators),
+                "renault cached data refresh",
+            )
+
+    async def _async_refresh_cached(
+        self, coordinators: list[RenaultDataUpdateCoordinator]
+    ) -> None:
+        """Refresh the coordinators filled from the cache, oldest first.
+
+        Refreshes are staggered, and skipped when the cached data is younger
+        than the scan interval: the coordinator timer will refresh it in time.
+        """
+        for coordinator in coordinators:
+            if (
+                coordinator.cached_at is None
+                or not coordinator.is_polled
+                or coordinator.update_interval is None
+                or dt_util.utcnow() - coordinator.cached_at
+                < coordinator.update_interval
+            ):
+                continue
+            await asyncio.sleep(DATA_CACHE_REFRESH_STAGGER_SECONDS)
+            await coordinator.async_refresh()
 
     async def async_initialise_vehicle(
         self,
@@ -148,32 +461,77 @@ class RenaultHub:
         renault_account: RenaultAccount,
         scan_interval: timedelta,
         config_entry: RenaultConfigEntry,
-        device_registry: dr.DeviceRegistry,
     ) -> None:
         """Set up proxy."""
         assert vehicle_link.vin is not None
         assert vehicle_link.vehicleDetails is not None
-        # Generate vehicle proxy
+        # Generate vehicle proxy, with the known details so that they are not
+        # fetched again from the servers
         vehicle = RenaultVehicleProxy(
             hass=self._hass,
             config_entry=config_entry,
             hub=self,
-            vehicle=await renault_account.get_api_vehicle(vehicle_link.vin),
+            vehicle=RenaultVehicle(
+                account_id=renault_account.account_id,
+                vin=vehicle_link.vin,
+                session=renault_account.session,
+                vehicle_details=vehicle_link.vehicleDetails,
+            ),
             details=vehicle_link.vehicleDetails,
             scan_interval=scan_interval,
         )
         await vehicle.async_initialise()
-        device_registry.async_get_or_create(
-            config_entry_id=config_entry.entry_id,
-            identifiers=vehicle.device_info[ATTR_IDENTIFIERS],
-            manufacturer=vehicle.device_info[ATTR_MANUFACTURER],
-            name=vehicle.device_info[ATTR_NAME],
-            model=vehicle.device_info[ATTR_MODEL],
-            model_id=vehicle.device_info[ATTR_MODEL_ID],
-            sw_version=None,  # cleanup from PR #125399
-        )
         self._vehicles[vehicle_link.vin] = vehicle
 
+    @callback
+    def _async_update_devices(self, config_entry: RenaultConfigEntry) -> None:
+        """Register the devices of the vehicles, once all of them are set up.
+
+        Devices already registered with the same details are skipped, so an
+        unchanged account does not write to the registry at startup.
+        """
+        device_registry = dr.async_get(self._hass)
+        for vehicle in self._vehicles.values():
+            device_info = vehicle.device_info
+            device = device_registry.async_get_device(
+                identifiers=device_info[ATTR_IDENTIFIERS]
+            )
+            if (
+                device is not None
+                and config_entry.entry_id in device.config_entries
+                and (
+                    device.manufacturer,
+                    device.name,
+                    device.model,
+                    device.model_id,
+                    device.sw_version,
+                )
+                == (
+                    device_info[ATTR_MANUFACTURER],
+                    device_info[ATTR_NAME],
+                    device_info[ATTR_MODEL],
+                    device_info[ATTR_MODEL_ID],
+                    None,
+                )
+            ):
+                continue
+            device_registry.async_get_or_create(
+                config_entry_id=config_entry.entry_id,
+                identifiers=device_info[ATTR_IDENTIFIERS],
+                manufacturer=device_info[ATTR_MANUFACTURER],
+                name=device_info[ATTR_NAME],
+                model=device_info[ATTR_MODEL],
+                model_id=device_info[ATTR_MODEL_ID],
+                sw_version=None,  # cleanup from PR #125399
+            )
+
+    def get_entity_plan(self, details: KamereonVehicleDetails) -> RenaultEntityPlan:
+        """Get the coordinators and entities of the kind of a vehicle."""
+        kind = get_vehicle_kind(details)
+        if (plan := self._entity_plans.get(kind)) is None:
+            plan = self._entity_plans[kind] = RenaultEntityPlan(details, COORDINATORS)
+        return plan
+
     async def get_account_ids(self) -> list[str]:
         """Get Kamereon account ids."""
         accounts = []
@@ -185,6 +543,59 @@ class RenaultHub:
                 accounts.append(account.account_id)
         return accounts
 
+    @property
+    def data_cache(self) -> RenaultDataCache:
+        """Get the cache of the coordinators data."""
+        assert self._caches is not None
+        return self._caches.data
+
+    @property
+    def capability_cache(self) -> RenaultCapabilityCache:
+        """Get the cache of the unavailable endpoints."""
+        assert self._caches is not None
+        return self._caches.capabilities
+
+    @property
+    def account_cache(self) -> RenaultAccountCache:
+        """Get the cache of the account vehicles."""
+        assert self._caches is not None
+        return self._caches.account
+
+    @property
+    def battery_correction_cache(self) -> RenaultBatteryCorrectionCache:
+        """Get the cache of the battery level corrections."""
+        assert self._caches is not None
+        return self._caches.battery_correction
+
+    @property
+    def scheduler(self) -> RenaultRequestScheduler:
+        """Get the request scheduler of the account."""
+        return self._scheduler
+
+    @property
+    def calls_last_hour(self) -> int:
+        """Get the number of calls made to the Renault servers in the last hour."""
+        return self._ledger.count()
+
+    @property
+    def throttle_stats(self) -> dict[str, Any]:
+        """Get the throttle events and the learned cooldown."""
+        return {
+            "throttled": self._backoff.is_active(),
+            "throttle_events": self._backoff.events,
+            "cooldown_seconds": self._backoff.cooldown_seconds,
+        }
+
+    @property
+    def metrics(self) -> RenaultMetrics:
+        """Get the latency and error metrics of the calls."""
+        return self._metrics
+
+    @property
+    def polling(self) -> RenaultPollingAllocator:
+        """Get the polling budget allocator of the account."""
+        return self._polling
+
     @property
     def vehicles(self) -> dict[str, RenaultVehicleProxy]:
         """Get list of vehicles."""
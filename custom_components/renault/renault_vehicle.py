@@ -1,30 +1,48 @@
 """Proxy to handle account communication with Renault servers."""
 
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine
+from collections.abc import Awaitable, Callable, Coroutine, Mapping
+from contextvars import ContextVar
+import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import partial, wraps
 import logging
 from typing import TYPE_CHECKING, Any, Concatenate, cast
 
+from marshmallow import Schema, ValidationError
 from renault_api.exceptions import RenaultException
-from renault_api.kamereon import models
+from renault_api.kamereon import models, schemas
+from renault_api.kamereon.enums import ChargeState
 from renault_api.renault_vehicle import RenaultVehicle
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.util import dt as dt_util
 
 if TYPE_CHECKING:
     from . import RenaultConfigEntry
     from .renault_hub import RenaultHub
 
-from .const import DOMAIN
+from .batch import RenaultBatchUpdater
+from .battery_correction import BATTERY_PROFILES, BatteryLevelCorrection
+from .commands import RenaultCommandQueue
+from .const import (
+    ACTION_REFRESH_DELAYS_SECONDS,
+    CONF_BATCH_VEHICLE_UPDATES,
+    DOMAIN,
+    READ_FRESHNESS_SECONDS,
+)
 from .coordinator import RenaultDataUpdateCoordinator
+from .field_index import RenaultFieldIndex
+from .scheduler import PRIORITY_ACTION, PRIORITY_POLL, PRIORITY_REFRESH
 
 LOGGER = logging.getLogger(__name__)
 
+# Priority of the coordinator reads, raised for the refreshes after an action
+_READ_PRIORITY: ContextVar[int] = ContextVar("read_priority", default=PRIORITY_POLL)
+
 
 def with_error_wrapping[**_P, _R](
     func: Callable[Concatenate[RenaultVehicleProxy, _P], Awaitable[_R]],
@@ -50,6 +68,50 @@ def with_error_wrapping[**_P, _R](
     return wrapper
 
 
+def with_command_queue[**_P, _R](
+    kind: str,
+    expected: Callable[_P, tuple[str, dict[str, Any]] | None] | None = None,
+) -> Callable[
+    [Callable[Concatenate[RenaultVehicleProxy, _P], Awaitable[_R]]],
+    Callable[Concatenate[RenaultVehicleProxy, _P], Coroutine[Any, Any, _R]],
+]:
+    """Send the call through the command queue of the vehicle.
+
+    `expected` returns the coordinator and fields an action is expected to
+    change, if any: they are shown as soon as the action is queued, and
+    dropped again if it fails.
+    """
+
+    def decorator(
+        func: Callable[Concatenate[RenaultVehicleProxy, _P], Awaitable[_R]],
+    ) -> Callable[Concatenate[RenaultVehicleProxy, _P], Coroutine[Any, Any, _R]]:
+        @wraps(func)
+        async def wrapper(
+            self: RenaultVehicleProxy,
+            *args: _P.args,
+            **kwargs: _P.kwargs,
+        ) -> _R:
+            """Queue the call, collapsed with the pending calls of the same kind."""
+            send = partial(func, self, *args, **kwargs)
+            if expected is None or (result := expected(*args, **kwargs)) is None:
+                return await self.commands.async_submit(kind, send)
+            key, fields = result
+            if (coordinator := self.coordinators.get(key)) is None:
+                return await self.commands.async_submit(kind, send)
+            coordinator.async_set_optimistic_data(fields)
+            try:
+                response = await self.commands.async_submit(kind, send)
+            except Exception:
+                coordinator.async_drop_optimistic_data(fields)
+                raise
+            self._refresh_after_action(key, coordinator)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
 @dataclass
 class RenaultCoordinatorDescription:
     """Class describing Renault coordinators."""
@@ -60,6 +122,8 @@ class RenaultCoordinatorDescription:
         [RenaultVehicle],
         Callable[[], Awaitable[models.KamereonVehicleDataAttributes]],
     ]
+    # Schema to load the cached raw data
+    data_schema: Schema
     # Optional keys
     requires_electricity: bool = False
 
@@ -89,16 +153,37 @@ class RenaultVehicleProxy:
             name=details.registrationNumber or "",
         )
         self.coordinators: dict[str, RenaultDataUpdateCoordinator] = {}
+        self.field_index = RenaultFieldIndex()
         self.hvac_target_temperature = 21
         self._scan_interval = scan_interval
         self._hub = hub
-
-    def update_scan_interval(self, scan_interval: timedelta) -> None:
-        """Set the scan interval for the vehicle."""
-        if scan_interval != self._scan_interval:
-            self._scan_interval = scan_interval
-            for coordinator in self.coordinators.values():
+        # reads in flight, by coordinator key
+        self._reads: dict[str, asyncio.Task[Any]] = {}
+        self.commands = RenaultCommandQueue(
+            hass, config_entry, hub, cast(str, details.vin)
+        )
+        self.batch: RenaultBatchUpdater | None = None
+        # coordinators and entities, shared by the vehicles of the same kind
+        self.entity_plan = hub.get_entity_plan(details)
+        # refreshes following an action, by coordinator key
+        self._action_refreshes: dict[str, asyncio.Task[None]] = {}
+        # battery level correction, for the models reporting wrong full levels
+        self.battery_correction: BatteryLevelCorrection | None = None
+        vin = cast(str, details.vin)
+        profile = BATTERY_PROFILES.get(details.get_model_code() or "")
+        if profile is not None:
+            self.battery_correction = BatteryLevelCorrection(profile, vin)
+            if (state := hub.battery_correction_cache.get(vin)) is not None:
+                self.battery_correction.restore(state)
+
+    def update_scan_interval(self, scan_intervals: Mapping[str, timedelta]) -> None:
+        """Set the scan interval of each coordinator of the vehicle."""
+        for key, scan_interval in scan_intervals.items():
+            coordinator = self.coordinators[key]
+            if coordinator.update_interval not in (None, scan_interval):
                 coordinator.update_interval = scan_interval
+        if self.batch is not None:
+            self.batch.update_interval()
 
     @property
     def details(self) -> models.KamereonVehicleDetails:
@@ -112,27 +197,41 @@ class RenaultVehicleProxy:
 
     async def async_initialise(self) -> None:
         """Load available coordinators."""
+        vin = cast(str, self.details.vin)
+        model_code = self.details.get_model_code()
+        capabilities = self._hub.capability_cache
         self.coordinators = {
             coord.key: RenaultDataUpdateCoordinator(
                 self.hass,
                 self.config_entry,
                 self._hub,
                 LOGGER,
+                field_index=self.field_index,
+                vin=vin,
+                key=coord.key,
                 name=f"{self.details.vin} {coord.key}",
-                update_method=coord.update_method(self._vehicle),
+                update_method=self._poll_method(coord),
                 update_interval=self._scan_interval,
             )
-            for coord in COORDINATORS
-            if (
-                self.details.supports_endpoint(coord.endpoint)
-                and (not coord.requires_electricity or self.details.uses_electricity())
-            )
+            for coord in self.entity_plan.coordinators
+            if not self._is_known_unavailable(coord.key)
         }
-        # Check all coordinators
+        if self.config_entry.options.get(CONF_BATCH_VEHICLE_UPDATES, False):
+            self.batch = RenaultBatchUpdater(
+                self.hass, self.config_entry, vin, self.coordinators
+            )
+            for coordinator in self.coordinators.values():
+                coordinator.batched = True
+        # Coordinators with cached data are refreshed in the background by the hub
+        for coord in self.entity_plan.coordinators:
+            if coord.key in self.coordinators:
+                self._restore_coordinator(coord)
+        # Check all other coordinators
         await asyncio.gather(
             *(
                 coordinator.async_config_entry_first_refresh()
                 for coordinator in self.coordinators.values()
+                if coordinator.cached_at is None
             )
         )
         for key in list(self.coordinators):
@@ -145,6 +244,7 @@ class RenaultVehicleProxy:
                     coordinator.name,
                     coordinator.last_exception,
                 )
+                self.async_record_unavailable(coordinator)
                 del self.coordinators[key]
             elif coordinator.access_denied:
                 # Remove endpoint as it is denied for this vehicle.
@@ -153,9 +253,171 @@ class RenaultVehicleProxy:
                     coordinator.name,
                     coordinator.last_exception,
                 )
+                self.async_record_unavailable(coordinator)
                 del self.coordinators[key]
+        capabilities.async_set_coordinators(vin, model_code, list(self.coordinators))
+
+    def _poll_method(
+        self, coord: RenaultCoordinatorDescription
+    ) -> Callable[[], Awaitable[models.KamereonVehicleDataAttributes]]:
+        """Return the update method of a coordinator."""
+        fetch = coord.update_method(self._vehicle)
+        if coord.key == "battery" and self.battery_correction is not None:
+            fetch = partial(self._async_fetch_battery, fetch)
+
+        async def _async_poll() -> models.KamereonVehicleDataAttributes:
+            return await self._async_read(coord.key, fetch, _READ_PRIORITY.get())
+
+        return _async_poll
+
+    async def _async_read[_T](
+        self, key: str, fetch: Callable[[], Awaitable[_T]], priority: int
+    ) -> _T:
+        """Read an endpoint, sharing the call with concurrent reads of it."""
+        if (task := self._reads.get(key)) is None:
+            task = self._reads[key] = self.config_entry.async_create_task(
+                self.hass,
+                self._async_fetch(key, fetch, priority),
+                f"{DOMAIN} read {self.details.vin} {key}",
+            )
+            task.add_done_callback(lambda _: self._reads.pop(key, None))
+        else:
+            LOGGER.debug("Joining read in flight %s %s", self.details.vin, key)
+        # a cancelled caller must not cancel the read of the other callers
+        return cast(_T, await asyncio.shield(task))
+
+    async def _async_fetch[_T](
+        self, key: str, fetch: Callable[[], Awaitable[_T]], priority: int
+    ) -> _T:
+        """Wait for a slot of the hub, then read the endpoint."""
+        async with self._hub.async_call(key, priority):
+            return await fetch()
+
+    async def _async_fetch_battery(
+        self, fetch: Callable[[], Awaitable[models.KamereonVehicleDataAttributes]]
+    ) -> models.KamereonVehicleDataAttributes:
+        """Read the battery status, and correct its level once per payload."""
+        data = await fetch()
+        self._correct_battery_level(data, dt_util.utcnow())
+        return data
+
+    def _correct_battery_level(
+        self, data: models.KamereonVehicleDataAttributes, received_at: datetime
+    ) -> None:
+        """Correct the battery level of a payload, and store the correction."""
+        assert self.battery_correction is not None
+        self.battery_correction.update(
+            cast(models.KamereonVehicleBatteryStatusData, data), received_at
+        )
+        self._hub.battery_correction_cache.async_set(
+            cast(str, self.details.vin), self.battery_correction.as_dict()
+        )
+
+    async def _async_read_setting[_T: models.KamereonVehicleDataAttributes](
+        self, key: str, fetch: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Read settings for an action, from the coordinator if recent enough.
+
+        The settings are edited by the actions: each caller gets its own copy,
+        as the data may be shared with the coordinator and the other readers.
+        """
+        if (coordinator := self.coordinators.get(key)) is not None and (
+            data := coordinator.get_recent_data(READ_FRESHNESS_SECONDS)
+        ) is not None:
+            LOGGER.debug("Reusing recent data of %s", coordinator.name)
+        else:
+            data = await self._async_read(key, fetch, PRIORITY_ACTION)
+        return cast(_T, copy.deepcopy(data))
+
+    def _refresh_after_action(
+        self, key: str, coordinator: RenaultDataUpdateCoordinator
+    ) -> None:
+        """Refresh a coordinator after an action until its result is confirmed.
+
+        The coordinator is refreshed a few times until the servers confirm
+        the expected fields. A new action on the same coordinator restarts
+        the refreshes.
+        """
+        if (task := self._action_refreshes.pop(key, None)) is not None:
+            task.cancel()
+        task = self._action_refreshes[key] = (
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_action_refresh(coordinator),
+                f"{DOMAIN} action refresh {coordinator.name}",
+            )
+        )
+
+        def _forget(done: asyncio.Task[None]) -> None:
+            if self._action_refreshes.get(key) is done:
+                del self._action_refreshes[key]
+
+        task.add_done_callback(_forget)
+
+    async def _async_action_refresh(
+        self, coordinator: RenaultDataUpdateCoordinator
+    ) -> None:
+        """Refresh a coordinator until it confirmed an action, with growing delays."""
+        _READ_PRIORITY.set(PRIORITY_REFRESH)
+        for delay in ACTION_REFRESH_DELAYS_SECONDS:
+            await asyncio.sleep(delay)
+            await coordinator.async_refresh()
+            if not coordinator.has_optimistic_data:
+                LOGGER.debug("State of %s converged", coordinator.name)
+                return
+        LOGGER.debug("State of %s did not converge", coordinator.name)
+
+    @callback
+    def async_record_unavailable(
+        self, coordinator: RenaultDataUpdateCoordinator
+    ) -> None:
+        """Record that the endpoint of a coordinator is unsupported or denied."""
+        self._hub.capability_cache.async_set_unavailable(
+            coordinator.vin,
+            self.details.get_model_code(),
+            coordinator.key,
+            "not_supported" if coordinator.not_supported else "access_denied",
+        )
+
+    def _is_known_unavailable(self, key: str) -> bool:
+        """Check if the endpoint was found unsupported or denied recently."""
+        reason = self._hub.capability_cache.get_unavailable_reason(
+            cast(str, self.details.vin), self.details.get_model_code(), key
+        )
+        if reason is None:
+            return False
+        LOGGER.debug(
+            "Ignoring endpoint %s %s as it was found %s",
+            self.details.vin,
+            key,
+            reason,
+        )
+        return True
+
+    def _restore_coordinator(self, coord: RenaultCoordinatorDescription) -> None:
+        """Fill a coordinator with its cached data, if any."""
+        coordinator = self.coordinators[coord.key]
+        if (cached := self._hub.data_cache.get(coordinator.vin, coord.key)) is None:
+            return
+        raw_data, cached_at = cached
+        try:
+            data = coord.data_schema.load(raw_data)
+        except ValidationError as err:
+            LOGGER.debug("Ignoring cached data of %s: %s", coordinator.name, err)
+            return
+        if (
+            coord.key == "battery"
+            and self.battery_correction is not None
+            and not self.battery_correction.has_state
+        ):
+            self._correct_battery_level(data, cached_at)
+        coordinator.async_restore(data, cached_at)
 
     @with_error_wrapping
+    @with_command_queue(
+        "charge_mode",
+        lambda charge_mode: ("charge_mode", {"chargeMode": charge_mode}),
+    )
     async def set_charge_mode(
         self, charge_mode: str
     ) -> models.KamereonVehicleChargeModeActionData:
@@ -163,6 +425,14 @@ class RenaultVehicleProxy:
         return await self._vehicle.set_charge_mode(charge_mode)
 
     @with_error_wrapping
+    @with_command_queue(
+        "charge",
+        lambda when=None: (
+            None
+            if when is not None
+            else ("battery", {"chargingStatus": ChargeState.CHARGE_IN_PROGRESS.value})
+        ),
+    )
     async def set_charge_start(
         self, when: datetime | None = None
     ) -> models.KamereonVehicleChargingStartActionData:
@@ -170,11 +440,22 @@ class RenaultVehicleProxy:
         return await self._vehicle.set_charge_start(when)
 
     @with_error_wrapping
+    @with_command_queue(
+        "charge",
+        lambda: ("battery", {"chargingStatus": ChargeState.NOT_IN_CHARGE.value}),
+    )
     async def set_charge_stop(self) -> models.KamereonVehicleChargingStartActionData:
         """Stop vehicle charge."""
         return await self._vehicle.set_charge_stop()
 
     @with_error_wrapping
+    @with_command_queue(
+        "battery_soc",
+        lambda min_soc, target_soc: (
+            "battery_soc",
+            {"socMin": min_soc, "socTarget": target_soc},
+        ),
+    )
     async def set_battery_soc(
         self, min_soc: int, target_soc: int
     ) -> models.KamereonVehicleBatterySocActionData:
@@ -182,11 +463,18 @@ class RenaultVehicleProxy:
         return await self._vehicle.set_battery_soc(min=min_soc, target=target_soc)
 
     @with_error_wrapping
+    @with_command_queue("hvac", lambda: ("hvac_status", {"hvacStatus": "off"}))
     async def set_ac_stop(self) -> models.KamereonVehicleHvacStartActionData:
         """Stop vehicle ac."""
         return await self._vehicle.set_ac_stop()
 
     @with_error_wrapping
+    @with_command_queue(
+        "hvac",
+        lambda temperature, when=None: (
+            None if when is not None else ("hvac_status", {"hvacStatus": "on"})
+        ),
+    )
     async def set_ac_start(
         self, temperature: float, when: datetime | None = None
     ) -> models.KamereonVehicleHvacStartActionData:
@@ -195,10 +483,19 @@ class RenaultVehicleProxy:
 
     @with_error_wrapping
     async def get_hvac_settings(self) -> models.KamereonVehicleHvacSettingsData:
-        """Get vehicle hvac settings."""
-        return await self._vehicle.get_hvac_settings()
+        """Get vehicle hvac settings.
+
+        No coordinator reads them, so they always come from the servers: the
+        caller gets its own copy of the read shared with concurrent callers.
+        """
+        return copy.deepcopy(
+            await self._async_read(
+                "hvac_settings", self._vehicle.get_hvac_settings, PRIORITY_ACTION
+            )
+        )
 
     @with_error_wrapping
+    @with_command_queue("hvac_schedules")
     async def set_hvac_schedules(
         self, schedules: list[models.HvacSchedule]
     ) -> models.KamereonVehicleHvacScheduleActionData:
@@ -208,9 +505,15 @@ class RenaultVehicleProxy:
     @with_error_wrapping
     async def get_charging_settings(self) -> models.KamereonVehicleChargingSettingsData:
         """Get vehicle charging settings."""
-        return await self._vehicle.get_charging_settings()
+        return await self._async_read_setting(
+            "charging_settings", self._vehicle.get_charging_settings
+        )
 
     @with_error_wrapping
+    @with_command_queue(
+        "charge_schedules",
+        lambda schedules: ("charging_settings", {"schedules": schedules}),
+    )
     async def set_charge_schedules(
         self, schedules: list[models.ChargeSchedule]
     ) -> models.KamereonVehicleChargeScheduleActionData:
@@ -218,11 +521,13 @@ class RenaultVehicleProxy:
         return await self._vehicle.set_charge_schedules(schedules)
 
     @with_error_wrapping
+    @with_command_queue("horn")
     async def sound_horn(self) -> None:
         """Start vehicle horn."""
         await self._vehicle.start_horn()
 
     @with_error_wrapping
+    @with_command_queue("lights")
     async def flash_lights(self) -> None:
         """Start vehicle lights."""
         await self._vehicle.start_lights()
@@ -233,54 +538,64 @@ COORDINATORS: tuple[RenaultCoordinatorDescription, ...] = (
         endpoint="cockpit",
         key="cockpit",
         update_method=lambda x: x.get_cockpit,
+        data_schema=schemas.KamereonVehicleCockpitDataSchema,
     ),
     RenaultCoordinatorDescription(
         endpoint="hvac-status",
         key="hvac_status",
         update_method=lambda x: x.get_hvac_status,
+        data_schema=schemas.KamereonVehicleHvacStatusDataSchema,
     ),
     RenaultCoordinatorDescription(
         endpoint="location",
         key="location",
         update_method=lambda x: x.get_location,
+        data_schema=schemas.KamereonVehicleLocationDataSchema,
     ),
     RenaultCoordinatorDescription(
         endpoint="battery-status",
         key="battery",
         requires_electricity=True,
         update_method=lambda x: x.get_battery_status,
+        data_schema=schemas.KamereonVehicleBatteryStatusDataSchema,
     ),
     RenaultCoordinatorDescription(
         endpoint="charge-mode",
         key="charge_mode",
         requires_electricity=True,
         update_method=lambda x: x.get_charge_mode,
+        data_schema=schemas.KamereonVehicleChargeModeDataSchema,
     ),
     RenaultCoordinatorDescription(
         endpoint="charging-settings",
         key="charging_settings",
         requires_electricity=True,
         update_method=lambda x: x.get_charging_settings,
+        data_schema=schemas.KamereonVehicleChargingSettingsDataSchema,
     ),
     RenaultCoordinatorDescription(
         endpoint="lock-status",
         key="lock_status",
         update_method=lambda x: x.get_lock_status,
+        data_schema=schemas.KamereonVehicleLockStatusDataSchema,
     ),
     RenaultCoordinatorDescription(
         endpoint="res-state",
         key="res_state",
         update_method=lambda x: x.get_res_state,
+        data_schema=schemas.KamereonVehicleResStateDataSchema,
     ),
     RenaultCoordinatorDescription(
         endpoint="pressure",
         key="pressure",
         update_method=lambda x: x.get_tyre_pressure,
+        data_schema=schemas.KamereonVehicleTyrePressureDataSchema,
     ),
     RenaultCoordinatorDescription(
         endpoint="soc-levels",
         key="battery_soc",
         requires_electricity=True,
         update_method=lambda x: x.get_battery_soc,
+        data_schema=schemas.KamereonVehicleBatterySocDataSchema,
     ),
 )
@@ -0,0 +1,144 @@
+"""Request scheduler to share the Renault API quota of an account."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import heapq
+from itertools import count
+from time import monotonic
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .metrics import LatencyHistogram
+from .quota import CallLedger
+
+# Lower value is served first
+PRIORITY_ACTION = 0
+PRIORITY_REFRESH = 1
+PRIORITY_POLL = 2
+
+
+class RenaultRequestScheduler:
+    """Token bucket and priority queue for calls to the Renault servers.
+
+    One scheduler is owned by each hub, so accounts no longer wait on each
+    other: the bucket refills at the hourly quota of the account, and at most
+    `max_concurrency` calls of the account are in flight at the same time.
+
+    Every granted slot is recorded in the call ledger. Polls are deferred by
+    the coordinators themselves, before they ask for a slot, once the ledger
+    reaches the soft limit of the quota.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        ledger: CallLedger,
+        slot_wait: LatencyHistogram,
+        max_calls_per_hour: int,
+        max_concurrency: int,
+    ) -> None:
+        """Initialise scheduler."""
+        self._hass = hass
+        self._ledger = ledger
+        self._rate = max_calls_per_hour / 3600
+        self._capacity = float(max_calls_per_hour)
+        self._tokens = self._capacity
+        self._last_refill = monotonic()
+        self._max_concurrency = max_concurrency
+        self._in_flight = 0
+        self._queue: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = count()
+        self._wakeup: asyncio.TimerHandle | None = None
+        self._slot_wait = slot_wait
+
+    @asynccontextmanager
+    async def async_slot(self, priority: int = PRIORITY_POLL) -> AsyncIterator[None]:
+        """Wait for a token and a free slot, then hold the slot."""
+        await self._async_acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _async_acquire(self, priority: int) -> None:
+        """Queue the caller until it is allowed to call the servers."""
+        start = monotonic()
+        future: asyncio.Future[None] = self._hass.loop.create_future()
+        heapq.heappush(self._queue, (priority, next(self._sequence), future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # the slot was granted right before the cancellation
+                self._release()
+            raise
+
+        self._slot_wait.record(monotonic() - start)
+
+    def _release(self) -> None:
+        """Free a slot and serve the next callers."""
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._last_refill) * self._rate
+        )
+        self._last_refill = now
+
+    def _dispatch(self) -> None:
+        """Grant slots to queued callers, in priority then FIFO order."""
+        self._refill()
+        while self._queue and self._in_flight < self._max_concurrency:
+            priority, _, future = self._queue[0]
+            if future.done():
+                # cancelled while waiting
+                heapq.heappop(self._queue)
+                continue
+            if self._tokens < 1:
+                self._schedule_wakeup((1 - self._tokens) / self._rate)
+                return
+            heapq.heappop(self._queue)
+            self._tokens -= 1
+            self._in_flight += 1
+            self._ledger.record()
+            future.set_result(None)
+
+    def _schedule_wakeup(self, delay: float) -> None:
+        """Dispatch again after the delay, unless a wakeup comes sooner."""
+        when = self._hass.loop.time() + delay
+        if self._wakeup is not None:
+            if self._wakeup.when() <= when:
+                return
+            self._wakeup.cancel()
+        self._wakeup = self._hass.loop.call_at(when, self._on_wakeup)
+
+    def _on_wakeup(self) -> None:
+        """Handle the token wakeup timer."""
+        self._wakeup = None
+        self._dispatch()
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of callers waiting for a slot."""
+        return sum(1 for _, _, future in self._queue if not future.done())
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return queue and wait time metrics."""
+        self._refill()
+        return {
+            "queue_depth": self.queue_depth,
+            "in_flight": self._in_flight,
+            "max_concurrency": self._max_concurrency,
+            "tokens_available": round(self._tokens, 2),
+            "calls_last_hour": self._ledger.count(),
+            "wait_count": self._slot_wait.count,
+            "wait_seconds_avg": round(self._slot_wait.average or 0.0, 3),
+            "wait_seconds_max": round(self._slot_wait.max, 3),
+        }
@@ -10,15 +10,17 @@ from renault_api.kamereon.models import (
 )
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from . import RenaultConfigEntry
 from .entity import RenaultDataEntity, RenaultDataEntityDescription
+from .entity_plan import has_coordinator
 
 # Coordinator is used to centralize the data updates
-# but renault servers are unreliable and it's safer to queue action calls
-PARALLEL_UPDATES = 1
+# and action calls are queued, and collapsed, by the vehicle command queue
+PARALLEL_UPDATES = 0
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -40,8 +42,9 @@ async def async_setup_entry(
     entities: list[RenaultSelectEntity] = [
         RenaultSelectEntity(vehicle, description)
         for vehicle in config_entry.runtime_data.vehicles.values()
-        for description in SENSOR_TYPES
-        if description.coordinator in vehicle.coordinators
+        for description in vehicle.entity_plan.get_descriptions(
+            vehicle, Platform.SELECT, SENSOR_TYPES, has_coordinator
+        )
     ]
     async_add_entities(entities)
 
@@ -56,7 +59,7 @@ class RenaultSelectEntity[T: KamereonVehicleDataAttributes](
     @property
     def current_option(self) -> str | None:
         """Return the selected entity option to represent the entity state."""
-        return self.entity_description.value_fn(self)
+        return self._get_derived_value(self.entity_description.value_fn)
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -67,6 +70,7 @@ SENSOR_TYPES: tuple[RenaultSelectEntityDescription, ...] = (
     RenaultSelectEntityDescription[KamereonVehicleChargeModeData](
         key="charge_mode",
         coordinator="charge_mode",
+        source_fields=("chargeMode",),
         translation_key="charge_mode",
         options=["always", "always_charging", "schedule_mode", "scheduled"],
         update_fn=lambda e, option: e.vehicle.set_charge_mode(option),
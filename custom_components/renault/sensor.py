@@ -4,7 +4,7 @@ import logging
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, cast
+from typing import Any
 
 from renault_api.kamereon.models import (
     KamereonVehicleBatteryStatusData,
@@ -17,8 +17,6 @@ from renault_api.kamereon.models import (
     KamereonVehicleTyrePressureData,
 )
 
-from renault_api.kamereon.enums import ChargeState, PlugState
-
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -26,7 +24,9 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import (
+    EntityCategory,
     PERCENTAGE,
+    Platform,
     UnitOfEnergy,
     UnitOfLength,
     UnitOfPower,
@@ -34,15 +34,17 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
     UnitOfVolume,
-    ATTR_MODEL_ID,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.typing import StateType
-from homeassistant.util.dt import as_utc, parse_datetime
 
 from . import RenaultConfigEntry
+from .const import CONF_KAMEREON_ACCOUNT_ID, DOMAIN
 from .entity import RenaultDataEntity, RenaultDataEntityDescription
+from .helpers import get_utc_value
+from .renault_hub import RenaultHub
 from .renault_vehicle import RenaultVehicleProxy
 
 
@@ -63,35 +65,85 @@ class RenaultSensorEntityDescription[T: KamereonVehicleDataAttributes](
     value_lambda: Callable[[RenaultSensor[T]], StateType | datetime]
 
 
+@dataclass(frozen=True, kw_only=True)
+class RenaultAccountSensorEntityDescription(SensorEntityDescription):
+    """Class describing Renault account sensor entities."""
+
+    value_lambda: Callable[[RenaultHub], StateType]
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: RenaultConfigEntry,
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up the Renault entities from config entry."""
-    entities: list[RenaultSensor[Any]] = [
+    entities: list[SensorEntity] = [
         RenaultSensor(vehicle, description)
         for vehicle in config_entry.runtime_data.vehicles.values()
-        for description in SENSOR_TYPES
-        if description.coordinator in vehicle.coordinators
-        and (not description.requires_fuel or vehicle.details.uses_fuel())
-        and (not description.condition_lambda or description.condition_lambda(vehicle))
+        for description in vehicle.entity_plan.get_descriptions(
+            vehicle, Platform.SENSOR, SENSOR_TYPES, _is_supported
+        )
     ]
+    entities.extend(
+        RenaultAccountSensor(config_entry, description)
+        for description in ACCOUNT_SENSOR_TYPES
+    )
     async_add_entities(entities)
 
 
+def _is_supported(
+    vehicle: RenaultVehicleProxy, description: RenaultSensorEntityDescription[Any]
+) -> bool:
+    """Check if the vehicle supports a sensor."""
+    return (
+        description.coordinator in vehicle.coordinators
+        and (not description.requires_fuel or vehicle.details.uses_fuel())
+        and (not description.condition_lambda or description.condition_lambda(vehicle))
+    )
+
+
 class RenaultSensor[T: KamereonVehicleDataAttributes](
     RenaultDataEntity[T], SensorEntity
 ):
     """Mixin for sensor specific attributes."""
 
     entity_description: RenaultSensorEntityDescription[T]
-    _private_data: dict | None = None
 
     @property
     def native_value(self) -> StateType | datetime:
         """Return the state of this entity."""
-        return self.entity_description.value_lambda(self)
+        return self._get_derived_value(self.entity_description.value_lambda)
+
+
+class RenaultAccountSensor(SensorEntity):
+    """Diagnostic sensor of the calls made by a Renault account."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_has_entity_name = True
+    entity_description: RenaultAccountSensorEntityDescription
+
+    def __init__(
+        self,
+        config_entry: RenaultConfigEntry,
+        description: RenaultAccountSensorEntityDescription,
+    ) -> None:
+        """Initialise entity."""
+        account_id: str = config_entry.data[CONF_KAMEREON_ACCOUNT_ID]
+        self.hub = config_entry.runtime_data
+        self.entity_description = description
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, account_id)},
+            entry_type=DeviceEntryType.SERVICE,
+            manufacturer="Renault",
+            name=config_entry.title,
+        )
+        self._attr_unique_id = f"{account_id}_{description.key}".lower()
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of this entity."""
+        return self.entity_description.value_lambda(self.hub)
 
 
 def _get_charge_state_formatted(
@@ -117,13 +169,6 @@ def _get_rounded_value(value: float | None) -> int | None:
     return round(value)
 
 
-def _get_utc_value(value: str | None) -> datetime | None:
-    """Return the UTC value of this entity."""
-    if (value is None) or (original_dt := parse_datetime(value)) is None:
-        return None
-    return as_utc(original_dt)
-
-
 def _get_charging_settings_mode_formatted(
     entity: RenaultSensor[KamereonVehicleChargingSettingsData],
 ) -> str | None:
@@ -131,140 +176,29 @@ def _get_charging_settings_mode_formatted(
     charging_mode = entity.coordinator.data.mode
     return charging_mode.lower() if charging_mode else None
 
-def _get_battery_level(entity: RenaultSensor[KamereonVehicleBatteryStatusData]) -> StateType:
-    """Return the battery_level of this entity."""
-
-    percent_value = entity.coordinator.data.batteryLevel
-
-    if percent_value is not None and entity.vehicle.device_info.get(ATTR_MODEL_ID, "") == "X071VE":
-
-        orig_value = percent_value
-        if entity._private_data is None:
-            entity._private_data = {}
-
-        data = cast(KamereonVehicleBatteryStatusData, entity.coordinator.data)
-        charging_status = data.get_charging_status()
-        plug_status = data.get_plug_status()
-        plug_status_native = data.plugStatus
-
-        autonomy = data.batteryAutonomy
-
-        if charging_status is None:
-            charging_status = ChargeState.UNAVAILABLE
-
-        if plug_status is None:
-            plug_status = PlugState.PLUG_UNKNOWN
-
-        # correct here the "plug state 3" issue
-        if plug_status_native is not None and plug_status_native == 3:
-            plug_status = PlugState.PLUGGED
-
-        if percent_value >= 100:
-
-            if autonomy is not None and autonomy >= 150:
-                # all good, we are at 100% and the autonomy is ok
-                entity._private_data["had_a_good_100"] = True
-            else:
-                # for the twingo III there is a known issue with the battery level when at 100% : it can be completely erroneous
-                # in this case we first check if charge_status is defined
-
-                prev_status = entity._private_data.get("last_charging_available_status", ChargeState.UNAVAILABLE)
-
-                # if charge ended by the car ... assume the battery is full so 100% is ok!
-                if charging_status == ChargeState.CHARGE_ENDED or prev_status == ChargeState.CHARGE_ENDED:
-                    entity._private_data["had_a_good_100"] = True
-                elif entity._private_data.get("had_a_good_100", False) is False:
-
-                    # from what we can see, the state WAITING_FOR_CURRENT_CHARGE when at 100% indicates an error
-                    # same for a bad or unknown plug state
-                    if (
-                        charging_status == ChargeState.WAITING_FOR_CURRENT_CHARGE
-                        or charging_status == ChargeState.UNAVAILABLE
-                        or plug_status == PlugState.PLUG_UNKNOWN
-                    ):
-                        # if the car is not charging, we assume that the battery is not full
-                        LOGGER.warning(f"Twingo III 100% battery fix due to charging status {charging_status} or plug_status {plug_status}")
-                        percent_value = None
-
-
-                    if percent_value is not None and entity._private_data.get("last_non_full_battery_value_timestamp") is not None:
-                        # we will check that the battery couldn't have been charged to 100% in the meantime
-                        delta_h = ((datetime.now() - entity._private_data["last_non_full_battery_value_timestamp"]).total_seconds())/3600
-
-                        # the twingo has a battery of 22kWh and a maximum charging power of 22kW
-                        charge_power = (((percent_value - entity._private_data["last_non_full_battery_value"])/100.0)*(22))/delta_h
-
-                        # maximum charging power of 22kW for the twingo
-                        if charge_power > 22:
-                            LOGGER.warning(
-                                f"Twingo III 100% battery fix prev value: {entity._private_data["last_non_full_battery_value"]}% {(datetime.now() - entity._private_data["last_non_full_battery_value_timestamp"])} ago "
-                            )
-                            percent_value = None
-
-
-                    if percent_value is not None and entity._private_data.get("prev_value") is not None:
-                        if entity._private_data.get("prev_value") < 100:
-                            # ok we where not at 100% before, we are now : it is a transition ... but shouldn't be if not charging!
-                            if prev_status != ChargeState.CHARGE_IN_PROGRESS and charging_status != ChargeState.CHARGE_IN_PROGRESS:
-                                # we are not charging and we are at 100% : this is a bad transition
-                                # we will set the value to None
-                                LOGGER.warning(
-                                    f"Twingo III 100% battery fix not charging transition: {prev_status} {charging_status} % "
-                                )
-                                percent_value = None
-
-                    if percent_value is not None:
-                        if autonomy is None or autonomy < 130:
-                            # if the autonomy is less than 175km ... we are 100% value, we assume that the battery is not full
-                            # we can use a direct hard coded constant as the twingo III has a known unique 22kWh battery
-                            # and a unique motor and consumption
-                            # ex of battery_status with this issue, the renault application shows 100% erroneously too:
-                            # {"data":{"id":"VF1AAAAAAAAAAAAAA","attributes":{"timestamp":"2025-05-02T03:16:45Z","batteryLevel":100,"batteryAutonomy":41,"plugStatus":1,"chargingStatus":0.3,"chargingRemainingTime":15}}}
-                            LOGGER.warning(f"Twingo III 100% battery fix autonomy: {autonomy}km")
-                            percent_value = None
-
-                    if prev_status == ChargeState.CHARGE_IN_PROGRESS or charging_status == ChargeState.CHARGE_IN_PROGRESS:
-                        entity._private_data["had_a_charge_during_100_period"] = True
-
-                    if percent_value is None:
-                        entity._private_data["had_abnormal_transition_100"] = True
-                    elif entity._private_data.get("had_abnormal_transition_100", False) is True:
-                        if entity._private_data.get("had_a_charge_during_100_period", False) is True:
-                            # so 100 is possible ...even if it was not before
-                            pass
-                        else:
-                            percent_value = None
-
-                    # possible value fix
-                    if autonomy is not None and int(entity._private_data.get("last_non_full_autonomy_value", 500)) == int(autonomy):
-                        # if the autonomy is the same as the last non full autonomy value, we assume that the battery is not full
-                        # this is a fix for the twingo III where the autonomy is not updated when at 100%
-
-                        percent_value = entity._private_data.get("last_non_full_battery_value")
-                        LOGGER.warning(
-                            f"Twingo III 100% battery fix autonomy: {autonomy}km same as last non full autonomy value, return percent_value: {percent_value}% "
-                        )
-
-        else:
-            entity._private_data["last_non_full_autonomy_value"] = data.batteryAutonomy
-            entity._private_data["last_non_full_battery_value"] = orig_value
-            entity._private_data["last_non_full_battery_value_timestamp"] = datetime.now()
-            entity._private_data["had_abnormal_transition_100"] = False
-            entity._private_data["had_a_good_100"] = False
-            entity._private_data["had_a_charge_during_100_period"] = False
-
-        if charging_status != ChargeState.UNAVAILABLE:
-            entity._private_data["last_charging_available_status"] = charging_status
-
-        entity._private_data["prev_value"] = orig_value
-
-
-    return percent_value
+
+def _get_battery_level(
+    entity: RenaultSensor[KamereonVehicleBatteryStatusData],
+) -> StateType:
+    """Return the battery_level of this entity, corrected for some models."""
+    if (correction := entity.vehicle.battery_correction) is not None:
+        return correction.value
+    return entity.coordinator.data.batteryLevel
+
 
 SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleBatteryStatusData](
         key="battery_level",
         coordinator="battery",
+        # the correction also depends on the time of the payload: a level
+        # rejected as charged too fast can be accepted on a later payload
+        source_fields=(
+            "batteryLevel",
+            "batteryAutonomy",
+            "chargingStatus",
+            "plugStatus",
+            "timestamp",
+        ),
         device_class=SensorDeviceClass.BATTERY,
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -273,6 +207,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleBatteryStatusData](
         key="charge_state",
         coordinator="battery",
+        source_fields=("chargingStatus",),
         translation_key="charge_state",
         device_class=SensorDeviceClass.ENUM,
         options=[
@@ -290,6 +225,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleBatteryStatusData](
         key="charging_remaining_time",
         coordinator="battery",
+        source_fields=("chargingRemainingTime",),
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement=UnitOfTime.MINUTES,
         state_class=SensorStateClass.MEASUREMENT,
@@ -303,6 +239,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
         key="charging_power",
         condition_lambda=lambda a: not a.details.reports_charging_power_in_watts(),
         coordinator="battery",
+        source_fields=("chargingInstantaneousPower",),
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.KILO_WATT,
         state_class=SensorStateClass.MEASUREMENT,
@@ -315,6 +252,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
         key="charging_power",
         condition_lambda=lambda a: a.details.reports_charging_power_in_watts(),
         coordinator="battery",
+        source_fields=("chargingInstantaneousPower",),
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.WATT,
         suggested_unit_of_measurement=UnitOfPower.KILO_WATT,
@@ -325,6 +263,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleBatteryStatusData](
         key="plug_state",
         coordinator="battery",
+        source_fields=("plugStatus",),
         translation_key="plug_state",
         device_class=SensorDeviceClass.ENUM,
         options=[
@@ -339,6 +278,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleBatteryStatusData](
         key="battery_autonomy",
         coordinator="battery",
+        source_fields=("batteryAutonomy",),
         device_class=SensorDeviceClass.DISTANCE,
         native_unit_of_measurement=UnitOfLength.KILOMETERS,
         state_class=SensorStateClass.MEASUREMENT,
@@ -348,6 +288,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleBatteryStatusData](
         key="battery_available_energy",
         coordinator="battery",
+        source_fields=("batteryAvailableEnergy",),
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
@@ -357,6 +298,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleBatteryStatusData](
         key="battery_temperature",
         coordinator="battery",
+        source_fields=("batteryTemperature",),
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
@@ -366,14 +308,16 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleBatteryStatusData](
         key="battery_last_activity",
         coordinator="battery",
+        source_fields=("timestamp",),
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_registry_enabled_default=False,
-        value_lambda=lambda e: _get_utc_value(e.coordinator.data.timestamp),
+        value_lambda=lambda e: get_utc_value(e.coordinator.data.timestamp),
         translation_key="battery_last_activity",
     ),
     RenaultSensorEntityDescription[KamereonVehicleCockpitData](
         key="mileage",
         coordinator="cockpit",
+        source_fields=("totalMileage",),
         device_class=SensorDeviceClass.DISTANCE,
         native_unit_of_measurement=UnitOfLength.KILOMETERS,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -383,6 +327,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleCockpitData](
         key="fuel_autonomy",
         coordinator="cockpit",
+        source_fields=("fuelAutonomy",),
         device_class=SensorDeviceClass.DISTANCE,
         native_unit_of_measurement=UnitOfLength.KILOMETERS,
         state_class=SensorStateClass.MEASUREMENT,
@@ -393,6 +338,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleCockpitData](
         key="fuel_quantity",
         coordinator="cockpit",
+        source_fields=("fuelQuantity",),
         device_class=SensorDeviceClass.VOLUME,
         native_unit_of_measurement=UnitOfVolume.LITERS,
         state_class=SensorStateClass.TOTAL,
@@ -403,6 +349,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleHvacStatusData](
         key="outside_temperature",
         coordinator="hvac_status",
+        source_fields=("externalTemperature",),
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
@@ -412,6 +359,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleHvacStatusData](
         key="hvac_soc_threshold",
         coordinator="hvac_status",
+        source_fields=("socThreshold",),
         native_unit_of_measurement=PERCENTAGE,
         translation_key="hvac_soc_threshold",
         value_lambda=lambda e: e.coordinator.data.socThreshold,
@@ -419,28 +367,32 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleHvacStatusData](
         key="hvac_last_activity",
         coordinator="hvac_status",
+        source_fields=("lastUpdateTime",),
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_registry_enabled_default=False,
         translation_key="hvac_last_activity",
-        value_lambda=lambda e: _get_utc_value(e.coordinator.data.lastUpdateTime),
+        value_lambda=lambda e: get_utc_value(e.coordinator.data.lastUpdateTime),
     ),
     RenaultSensorEntityDescription[KamereonVehicleLocationData](
         key="location_last_activity",
         coordinator="location",
+        source_fields=("lastUpdateTime",),
         device_class=SensorDeviceClass.TIMESTAMP,
         entity_registry_enabled_default=False,
         translation_key="location_last_activity",
-        value_lambda=lambda e: _get_utc_value(e.coordinator.data.lastUpdateTime),
+        value_lambda=lambda e: get_utc_value(e.coordinator.data.lastUpdateTime),
     ),
     RenaultSensorEntityDescription[KamereonVehicleResStateData](
         key="res_state",
         coordinator="res_state",
+        source_fields=("details",),
         translation_key="res_state",
         value_lambda=lambda e: e.coordinator.data.details,
     ),
     RenaultSensorEntityDescription[KamereonVehicleResStateData](
         key="res_state_code",
         coordinator="res_state",
+        source_fields=("code",),
         entity_registry_enabled_default=False,
         translation_key="res_state_code",
         value_lambda=lambda e: e.coordinator.data.code,
@@ -448,6 +400,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleChargingSettingsData](
         key="charging_settings_mode",
         coordinator="charging_settings",
+        source_fields=("mode",),
         translation_key="charging_settings_mode",
         device_class=SensorDeviceClass.ENUM,
         options=[
@@ -460,6 +413,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleTyrePressureData](
         key="front_left_pressure",
         coordinator="pressure",
+        source_fields=("flPressure",),
         device_class=SensorDeviceClass.PRESSURE,
         native_unit_of_measurement=UnitOfPressure.MBAR,
         state_class=SensorStateClass.MEASUREMENT,
@@ -469,6 +423,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleTyrePressureData](
         key="front_right_pressure",
         coordinator="pressure",
+        source_fields=("frPressure",),
         device_class=SensorDeviceClass.PRESSURE,
         native_unit_of_measurement=UnitOfPressure.MBAR,
         state_class=SensorStateClass.MEASUREMENT,
@@ -478,6 +433,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleTyrePressureData](
         key="rear_left_pressure",
         coordinator="pressure",
+        source_fields=("rlPressure",),
         device_class=SensorDeviceClass.PRESSURE,
         native_unit_of_measurement=UnitOfPressure.MBAR,
         state_class=SensorStateClass.MEASUREMENT,
@@ -487,6 +443,7 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
     RenaultSensorEntityDescription[KamereonVehicleTyrePressureData](
         key="rear_right_pressure",
         coordinator="pressure",
+        source_fields=("rrPressure",),
         device_class=SensorDeviceClass.PRESSURE,
         native_unit_of_measurement=UnitOfPressure.MBAR,
         state_class=SensorStateClass.MEASUREMENT,
@@ -494,3 +451,40 @@ SENSOR_TYPES: tuple[RenaultSensorEntityDescription[Any], ...] = (
         value_lambda=lambda e: e.coordinator.data.rrPressure,
     ),
 )
+
+ACCOUNT_SENSOR_TYPES: tuple[RenaultAccountSensorEntityDescription, ...] = (
+    RenaultAccountSensorEntityDescription(
+        key="calls_last_hour",
+        state_class=SensorStateClass.MEASUREMENT,
+        translation_key="calls_last_hour",
+        value_lambda=lambda hub: hub.calls_last_hour,
+    ),
+    RenaultAccountSensorEntityDescription(
+        key="throttle_events",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        translation_key="throttle_events",
+        value_lambda=lambda hub: hub.throttle_stats["throttle_events"],
+    ),
+    RenaultAccountSensorEntityDescription(
+        key="call_errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        translation_key="call_errors",
+        value_lambda=lambda hub: hub.metrics.error_count,
+    ),
+    RenaultAccountSensorEntityDescription(
+        key="call_latency_p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        translation_key="call_latency_p95",
+        value_lambda=lambda hub: hub.metrics.percentile(0.95),
+    ),
+    RenaultAccountSensorEntityDescription(
+        key="slot_wait_p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        translation_key="slot_wait_p95",
+        value_lambda=lambda hub: hub.metrics.slot_wait.percentile(0.95),
+    ),
+)
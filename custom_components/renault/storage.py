@@ -0,0 +1,262 @@
+"""Persistent caches of the Renault integration."""
+
+import asyncio
+from datetime import datetime
+from typing import Any, cast
+
+from marshmallow import ValidationError
+from renault_api.kamereon import models, schemas
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import CAPABILITY_CACHE_TTL, DATA_CACHE_SAVE_DELAY_SECONDS, DOMAIN
+
+STORAGE_VERSION = 1
+
+DATA_CACHES: HassKey[dict[str, RenaultCaches]] = HassKey(f"{DOMAIN}_caches")
+
+
+class _RenaultCache:
+    """Base class for a cache of a config entry."""
+
+    _name: str
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialise cache."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.{self._name}"
+        )
+        self._data: dict[str, dict[str, Any]] = {}
+        self._pending = False
+
+    async def async_load(self) -> None:
+        """Load the cache from disk."""
+        self._data = await self._store.async_load() or {}
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save the cache to disk, later.
+
+        The store delays the save again on each call: while a save is
+        pending, it is not delayed any further, so that frequent changes
+        are still written every `DATA_CACHE_SAVE_DELAY_SECONDS`.
+        """
+        if self._pending:
+            return
+        self._pending = True
+        self._store.async_delay_save(self._data_to_save, DATA_CACHE_SAVE_DELAY_SECONDS)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the data to store."""
+        self._pending = False
+        return self._data
+
+    async def async_flush(self) -> None:
+        """Save the pending changes now, cancelling the delayed save."""
+        if self._pending:
+            self._pending = False
+            await self._store.async_save(self._data)
+
+    async def async_remove(self) -> None:
+        """Remove the cache from disk, with its pending save."""
+        self._pending = False
+        self._data = {}
+        await self._store.async_remove()
+
+
+class RenaultDataCache(_RenaultCache):
+    """Last successful payload of each coordinator, kept across restarts."""
+
+    _name = "data"
+
+    @callback
+    def get(self, vin: str, key: str) -> tuple[dict[str, Any], datetime] | None:
+        """Return the cached payload of a coordinator, and when it was received."""
+        if (entry := self._data.get(vin, {}).get(key)) is None:
+            return None
+        if (timestamp := dt_util.parse_datetime(entry["timestamp"])) is None:
+            return None
+        return entry["raw_data"], timestamp
+
+    @callback
+    def async_set(self, vin: str, key: str, raw_data: dict[str, Any]) -> None:
+        """Cache the payload of a coordinator."""
+        self._data.setdefault(vin, {})[key] = {
+            "raw_data": raw_data,
+            "timestamp": dt_util.utcnow().isoformat(),
+        }
+        self._async_schedule_save()
+
+
+class RenaultCapabilityCache(_RenaultCache):
+    """Endpoints found unsupported or denied for a vehicle, kept across restarts.
+
+    Entries are bound to the model code of the vehicle, and expire after
+    `CAPABILITY_CACHE_TTL` so that the endpoints are probed again.
+    """
+
+    _name = "capabilities"
+
+    @callback
+    def _get_vehicle(self, vin: str, model_code: str | None) -> dict[str, Any]:
+        """Return the entry of the vehicle, reset if the model changed."""
+        entry = self._data.get(vin)
+        if entry is None or entry["model_code"] != model_code:
+            entry = self._data[vin] = {
+                "model_code": model_code,
+                "unavailable": {},
+                "coordinators": None,
+            }
+        return entry
+
+    @callback
+    def get_unavailable_reason(
+        self, vin: str, model_code: str | None, key: str
+    ) -> str | None:
+        """Return why an endpoint is unavailable, if known and not expired."""
+        entry = self._data.get(vin)
+        if entry is None or entry["model_code"] != model_code:
+            return None
+        if (unavailable := entry["unavailable"].get(key)) is None:
+            return None
+        if (
+            timestamp := dt_util.parse_datetime(unavailable["timestamp"])
+        ) is None or dt_util.utcnow() - timestamp > CAPABILITY_CACHE_TTL:
+            return None
+        return unavailable["reason"]
+
+    @callback
+    def get_coordinator_count(self, vin: str, model_code: str | None) -> int | None:
+        """Return the number of active coordinators at the last startup."""
+        entry = self._data.get(vin)
+        if entry is None or entry["model_code"] != model_code:
+            return None
+        return None if entry["coordinators"] is None else len(entry["coordinators"])
+
+    @callback
+    def async_set_unavailable(
+        self, vin: str, model_code: str | None, key: str, reason: str
+    ) -> None:
+        """Record that an endpoint is unsupported or denied."""
+        self._get_vehicle(vin, model_code)["unavailable"][key] = {
+            "reason": reason,
+            "timestamp": dt_util.utcnow().isoformat(),
+        }
+        self._async_schedule_save()
+
+    @callback
+    def async_set_coordinators(
+        self, vin: str, model_code: str | None, keys: list[str]
+    ) -> None:
+        """Record the active coordinators of a vehicle."""
+        entry = self._get_vehicle(vin, model_code)
+        entry["coordinators"] = keys
+        for key in keys:
+            entry["unavailable"].pop(key, None)
+        self._async_schedule_save()
+
+
+class RenaultAccountCache(_RenaultCache):
+    """Vehicles of the Kamereon account, kept across restarts."""
+
+    _name = "account"
+
+    @callback
+    def get_vehicles(self, account_id: str) -> models.KamereonVehiclesResponse | None:
+        """Return the cached vehicles of the account."""
+        if (entry := self._data.get(account_id)) is None:
+            return None
+        try:
+            return cast(
+                models.KamereonVehiclesResponse,
+                schemas.KamereonVehiclesResponseSchema.load(entry["vehicles"]),
+            )
+        except ValidationError:
+            return None
+
+    @callback
+    def async_set_vehicles(
+        self, account_id: str, vehicles: models.KamereonVehiclesResponse
+    ) -> bool:
+        """Cache the vehicles of the account, return True if they changed."""
+        previous = self._data.get(account_id, {}).get("vehicles")
+        self._data[account_id] = {
+            "vehicles": vehicles.raw_data,
+            "timestamp": dt_util.utcnow().isoformat(),
+        }
+        self._async_schedule_save()
+        return previous != vehicles.raw_data
+
+
+class RenaultBatteryCorrectionCache(_RenaultCache):
+    """State of the battery level correction of each vehicle, kept across restarts."""
+
+    _name = "battery_correction"
+
+    @callback
+    def get(self, vin: str) -> dict[str, Any] | None:
+        """Return the stored state of the correction of a vehicle."""
+        return self._data.get(vin)
+
+    @callback
+    def async_set(self, vin: str, state: dict[str, Any]) -> None:
+        """Store the state of the correction of a vehicle."""
+        self._data[vin] = state
+        self._async_schedule_save()
+
+
+class RenaultCaches:
+    """Caches of a config entry, shared by its successive loads.
+
+    The caches outlive the hub: pending saves are flushed when the entry is
+    unloaded, and a reload or the removal of the entry goes through the same
+    stores, so that no delayed save writes a file behind them.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialise caches."""
+        self.data = RenaultDataCache(hass, entry_id)
+        self.capabilities = RenaultCapabilityCache(hass, entry_id)
+        self.account = RenaultAccountCache(hass, entry_id)
+        self.battery_correction = RenaultBatteryCorrectionCache(hass, entry_id)
+        self._loaded = False
+
+    @property
+    def _caches(self) -> tuple[_RenaultCache, ...]:
+        return (self.data, self.capabilities, self.account, self.battery_correction)
+
+    async def async_load(self) -> None:
+        """Load the caches from disk, once."""
+        if self._loaded:
+            return
+        await asyncio.gather(*(cache.async_load() for cache in self._caches))
+        self._loaded = True
+
+    async def async_flush(self) -> None:
+        """Save the pending changes of the caches now."""
+        await asyncio.gather(*(cache.async_flush() for cache in self._caches))
+
+    async def async_remove(self) -> None:
+        """Remove the caches from disk."""
+        await asyncio.gather(*(cache.async_remove() for cache in self._caches))
+
+
+@callback
+def async_get_caches(hass: HomeAssistant, entry_id: str) -> RenaultCaches:
+    """Return the caches of a config entry."""
+    caches = hass.data.setdefault(DATA_CACHES, {})
+    if (entry_caches := caches.get(entry_id)) is None:
+        entry_caches = caches[entry_id] = RenaultCaches(hass, entry_id)
+    return entry_caches
+
+
+@callback
+def async_pop_caches(hass: HomeAssistant, entry_id: str) -> RenaultCaches:
+    """Return the caches of a config entry, and forget them."""
+    return hass.data.get(DATA_CACHES, {}).pop(entry_id, None) or RenaultCaches(
+        hass, entry_id
+    )